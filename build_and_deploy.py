@@ -7,16 +7,109 @@ This version includes enhanced debugging to troubleshoot GitHub upload issues.
 """
 
 import os
+import re
 import sys
 import json
+import mmap
 import shutil
+import hashlib
 import argparse
+import importlib.util
+import threading
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+# Matched against raw bytes so the main script never needs decoding
+_CURRENT_VERSION_RE = re.compile(rb'CURRENT_VERSION = "[^"]*"')
+
+# Release naming, shared with upload_helper.py
+APP_NAME = "ITFTennisScraperPro"
+RELEASES_DIR_NAME = "releases"
+DEFAULT_GITHUB_REPO = "carpsesdema/itf-tennis-scraper"
+
+# Read size used when streaming release assets to GitHub
+UPLOAD_BLOCKSIZE = 1 << 20
+
+# Check, tag and push in a single shell; the tag is passed as $1.
+# An existing tag is fine (as before), only the push result decides success.
+_GIT_NOT_A_REPO = 3
+_GIT_TAG_SCRIPT = f"""
+git rev-parse --is-inside-work-tree >/dev/null || exit {_GIT_NOT_A_REPO}
+git tag "$1" 2>/dev/null || git rev-parse -q --verify "refs/tags/$1" >/dev/null \\
+    || echo "Could not create tag $1 locally" >&2
+git push origin "$1"
+"""
+
+# Block size for copying multi-MB executables where the OS offers no zero-copy path
+COPY_BLOCKSIZE = 1 << 20
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_and_deploy.py - edit the builder, not this file.
+
+a = Analysis(
+    [{main_script!r}],
+    pathex={pathex!r},
+    binaries=[],
+    datas=[],
+    hiddenimports={hidden_imports!r},
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes!r},
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name={app_name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+)
+"""
+
+
+def _fast_copy(src: Path, dst: Path):
+    """Copy a file through the OS's native copy routine where one is available"""
+    if sys.platform == 'win32':
+        try:
+            import win32file  # pywin32, optional
+            win32file.CopyFile(str(src), str(dst), False)
+            return
+        except ImportError:
+            # copy2 uses CopyFile2 on Python 3.12+, so the copy still stays in the kernel
+            shutil.copy2(src, dst)
+            return
+    if sys.platform.startswith('linux') or sys.platform == 'darwin':
+        # copyfile uses sendfile on Linux and fcopyfile on macOS
+        shutil.copyfile(src, dst)
+        return
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=COPY_BLOCKSIZE)
+
+
+def github_repo() -> str:
+    """Target repository, overridable through GITHUB_REPO"""
+    return os.getenv('GITHUB_REPO', DEFAULT_GITHUB_REPO)
 
-import requests
+
+def release_exe_name(version: str) -> str:
+    """File name of a built executable in the releases directory"""
+    return f"{APP_NAME}_v{version}.exe"
 
 
 class BuildError(Exception):
@@ -29,22 +122,80 @@ class DeploymentError(Exception):
     pass
 
 
+class _HashingReader:
+    """File wrapper that feeds every block read for an upload into a SHA-256 digest"""
+
+    def __init__(self, f, size: int):
+        self._f = f
+        self._size = size
+        self.digest = hashlib.sha256()
+
+    def __len__(self):
+        # Lets requests derive Content-Length instead of falling back to chunked encoding
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self.digest.update(data)
+        return data
+
+
 class TennisScraperBuilder:
     """Handles building and deploying the Tennis Scraper application"""
 
-    def __init__(self):
+    def __init__(self, jobs: Optional[int] = None):
         self.project_root = Path.cwd()
         self.dist_dir = self.project_root / "dist"
         self.build_dir = self.project_root / "build"
-        self.releases_dir = self.project_root / "releases"
+        self.releases_dir = self.project_root / RELEASES_DIR_NAME
+
+        # One directory scan up front instead of a stat per existence check
+        with os.scandir(self.project_root) as entries:
+            self._root_files = {entry.name for entry in entries if entry.is_file()}
+
+        # Worker threads for the builder's own parallel steps
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
 
         # GitHub configuration
         self.github_token = os.getenv('GITHUB_TOKEN')
-        self.github_repo = os.getenv('GITHUB_REPO', 'carpsesdema/itf-tennis-scraper')
+        self.github_repo = github_repo()
+
+        # One HTTP session per thread, created on its first GitHub call (see the `http` property)
+        self._http_local = threading.local()
+        self._http_sessions = []
+        self._http_lock = threading.Lock()
+        self._upload_headers = {'Content-Type': 'application/octet-stream'}
+
+        # Verbose request dumps, off unless DEBUG_BUILD is set
+        self.debug = bool(os.getenv('DEBUG_BUILD'))
+        # SHA-256 of each asset, computed while it was being uploaded
+        self._uploaded_digests = {}
+        self._git: Optional[str] = None
 
         # Application details
-        self.app_name = "ITFTennisScraperPro"
+        self.app_name = APP_NAME
         self.main_script = "main.py"
+        self.main_file = self.project_root / self.main_script
+        self._main_content: Optional[bytes] = None  # Main script source, read at most once per build
+        self.spec_file = self.project_root / f"{self.app_name}.spec"
+
+        # Hidden imports for modules PyInstaller's analysis tends to miss
+        # (openpyxl is only imported lazily by the Excel exporter)
+        self.hidden_imports = [
+            "PySide6.QtCore",
+            "PySide6.QtWidgets",
+            "PySide6.QtGui",
+            "requests",
+            "openpyxl"
+        ]
+
+        # Modules PyInstaller would otherwise pull in transitively
+        self.excludes = [
+            "tkinter",
+            "matplotlib",
+            "test",
+            "setuptools"
+        ]
 
         print(f"🎾 Tennis Scraper Builder (DEBUG MODE)")
         print(f"📁 Project root: {self.project_root}")
@@ -52,117 +203,274 @@ class TennisScraperBuilder:
         print(f"🔑 GitHub token: {'✅ SET' if self.github_token else '❌ NOT SET'}")
         print(f"🔑 Token length: {len(self.github_token) if self.github_token else 0} chars")
 
-    def clean_build_dirs(self):
+    @property
+    def http(self):
+        """Requests session for GitHub calls made from the current thread"""
+        # requests doesn't promise a Session is thread-safe, so parallel uploads each get their own
+        http = getattr(self._http_local, "session", None)
+        if http is None:
+            http = self._new_http_session()
+            self._http_local.session = http
+            with self._http_lock:
+                self._http_sessions.append(http)
+        return http
+
+    def _new_http_session(self):
+        # Imported lazily so --no-github builds don't pay for loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        class _BulkAdapter(HTTPAdapter):
+            # Send request bodies in large blocks instead of urllib3's 16 KiB default
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs.setdefault("blocksize", UPLOAD_BLOCKSIZE)
+                super().init_poolmanager(*args, **kwargs)
+
+        http = requests.Session()
+        http.headers.update({
+            "Authorization": f"token {self.github_token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "ITF-Tennis-Scraper-Builder"
+        })
+        adapter = _BulkAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        http.mount("https://", adapter)
+        return http
+
+    def close(self):
+        """Close every HTTP session opened for GitHub calls"""
+        with self._http_lock:
+            sessions, self._http_sessions = self._http_sessions, []
+        for http in sessions:
+            http.close()
+        self._http_local = threading.local()
+
+    def clean_build_dirs(self, include_work_dir: bool = False):
         """Clean previous build artifacts"""
         print("🧹 Cleaning build directories...")
 
-        dirs_to_clean = [self.dist_dir, self.build_dir]
+        # build/ holds PyInstaller's cached analysis; keep it unless a clean build was asked
+        # for or the inputs that shape the analysis have changed since it was produced
+        cache_key = self._build_cache_key()
+        cache_key_file = self.build_dir / ".cache_key"
+        if not include_work_dir and self.build_dir.exists():
+            try:
+                include_work_dir = cache_key_file.read_text(encoding='utf-8') != cache_key
+            except OSError:
+                include_work_dir = True
+            if include_work_dir:
+                print("   Dependencies changed, discarding cached build")
+
+        dirs_to_clean = [self.dist_dir]
+        if include_work_dir:
+            dirs_to_clean.append(self.build_dir)
+
+        # The trees are independent, so remove them concurrently to overlap unlink latency
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(dirs_to_clean))) as executor:
+            list(executor.map(lambda d: shutil.rmtree(d, ignore_errors=True), dirs_to_clean))
+
         for dir_path in dirs_to_clean:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
-                print(f"   Cleaned: {dir_path}")
+            dir_path.mkdir(parents=True, exist_ok=True)
+            print(f"   Cleaned: {dir_path}")
+
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+        cache_key_file.write_text(cache_key, encoding='utf-8')
 
         # Create releases directory
         self.releases_dir.mkdir(exist_ok=True)
         print("✅ Build directories cleaned")
 
+    def _build_cache_key(self) -> str:
+        """Hash of the files that decide what PyInstaller's cached analysis contains"""
+        digest = hashlib.sha256()
+        if "requirements.txt" in self._root_files:
+            digest.update((self.project_root / "requirements.txt").read_bytes())
+        return digest.hexdigest()
+
     def update_version_in_code(self, version: str):
         """Update the version number in the main script"""
         print(f"📝 Updating version to {version}...")
 
-        main_file = self.project_root / self.main_script
-        if not main_file.exists():
-            raise BuildError(f"Main script not found: {main_file}")
-
-        # Read the file
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        main_file = self.main_file
 
         # Replace the version
-        import re
-        pattern = r'CURRENT_VERSION = "[^"]*"'
-        replacement = f'CURRENT_VERSION = "{version}"'
-
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content)
+        replacement = f'CURRENT_VERSION = "{version}"'.encode('utf-8')
 
-            with open(main_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        if self._main_content is None:
+            if self.main_script not in self._root_files:
+                raise BuildError(f"Main script not found: {main_file}")
 
-            print(f"✅ Version updated to {version}")
-        else:
+            # Scan a memory map first so the common "already stamped" case skips reading the file in
+            with open(main_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raw = b""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        match = _CURRENT_VERSION_RE.search(mm)
+                        if match and match.group(0) == replacement:
+                            print(f"✅ Version already {version}, leaving {main_file.name} untouched")
+                            return
+                        raw = mm[:]
+            self._main_content = raw
+        content = self._main_content
+
+        new_content, replaced = _CURRENT_VERSION_RE.subn(replacement, content, count=1)
+        if replaced == 0:
             print("⚠️  Warning: Could not find CURRENT_VERSION in the main script")
-
-    def build_executable(self, version: str) -> Path:
-        """Build the executable using PyInstaller"""
-        print("🔨 Building executable...")
-
-        exe_name = f"{self.app_name}_v{version}"
+            return
+
+        if new_content == content:
+            print(f"✅ Version already {version}, leaving {main_file.name} untouched")
+            return
+
+        # Write to a temp file and swap it in, so an interrupted build can't truncate the script
+        tmp_file = main_file.with_suffix(main_file.suffix + '.tmp')
+        tmp_file.write_bytes(new_content)
+        os.replace(tmp_file, main_file)
+        self._main_content = new_content
+
+        print(f"✅ Version updated to {version}")
+
+    def write_spec_file(self) -> Path:
+        """Write the PyInstaller spec file, leaving it untouched if nothing changed"""
+        return self._write_spec(self.spec_file, self.main_script)
+
+    def _write_spec(self, spec_file: Path, main_script: str, pathex: Optional[list] = None) -> Path:
+        """Render the spec template to spec_file unless it already has that content"""
+        spec_content = SPEC_TEMPLATE.format(
+            main_script=main_script,
+            pathex=pathex or [],
+            hidden_imports=self.hidden_imports,
+            excludes=self.excludes,
+            app_name=self.app_name
+        )
+
+        if spec_file.exists() and spec_file.read_text(encoding='utf-8') == spec_content:
+            return spec_file
+
+        spec_file.write_text(spec_content, encoding='utf-8')
+        print(f"📝 Spec file written: {spec_file}")
+        return spec_file
+
+    def _write_stamped_workspace(self, version: str, workspace: Path) -> Path:
+        """Write a version-stamped copy of the main script and its spec into workspace"""
+        if self._main_content is None:
+            self._main_content = self.main_file.read_bytes()
+
+        script = workspace / self.main_script
+        stamped = _CURRENT_VERSION_RE.sub(f'CURRENT_VERSION = "{version}"'.encode('utf-8'),
+                                          self._main_content, count=1)
+        if not script.exists() or script.read_bytes() != stamped:
+            script.write_bytes(stamped)
+
+        # The copy lives outside the project, so point the analysis back at the package
+        return self._write_spec(workspace / self.spec_file.name, str(script),
+                                pathex=[str(self.project_root)])
+
+    def _vendor_cache_dir(self) -> Path:
+        """PyInstaller config dir keyed on requirements.txt, so vendor binaries are reused until deps change"""
+        key = "default"
+        if "requirements.txt" in self._root_files:
+            requirements = self.project_root / "requirements.txt"
+            key = hashlib.sha256(requirements.read_bytes()).hexdigest()[:12]
+        return self.build_dir / "_vendor_cache" / key
+
+    def build_executable(self, version: str, force_clean: bool = False,
+                         workspace: Optional[Path] = None) -> Tuple[Path, int]:
+        """Build the executable using PyInstaller and return its release path and size in bytes"""
+        print(f"🔨 Building executable for {version}...")
 
         # Check if PyInstaller is available
-        try:
-            import PyInstaller
-            print(f"✅ PyInstaller version: {PyInstaller.__version__}")
-        except ImportError:
+        if importlib.util.find_spec("PyInstaller") is None:
             raise BuildError("PyInstaller is not installed. Run: pip install pyinstaller")
 
+        if self.main_script not in self._root_files:
+            raise BuildError(f"Main script not found: {self.main_file}")
+
+        env = os.environ.copy()
+        if workspace is None:
+            dist_dir, work_dir = self.dist_dir, self.build_dir
+            # Build from a stable spec so PyInstaller can reuse its cached analysis
+            spec_file = self.write_spec_file()
+            env["PYINSTALLER_CONFIG_DIR"] = str(self._vendor_cache_dir())
+        else:
+            # Own script, spec, output dirs and config dir, so builds can run side by side
+            workspace.mkdir(parents=True, exist_ok=True)
+            dist_dir, work_dir = workspace / "dist", workspace / "work"
+            spec_file = self._write_stamped_workspace(version, workspace)
+            env["PYINSTALLER_CONFIG_DIR"] = str(workspace / "config")
+
         # PyInstaller command
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--onefile",
-            "--windowed",
-            "--name", exe_name,
-            "--distpath", str(self.dist_dir),
-            "--workpath", str(self.build_dir),
-            "--specpath", str(self.build_dir),
-            "--clean",
-            "--noconsole",
-        ]
-
-        # Add hidden imports for common issues
-        hidden_imports = [
-            "selenium.webdriver.chrome.service",
-            "PySide6.QtCore",
-            "PySide6.QtWidgets",
-            "PySide6.QtGui",
-            "requests",
-            "bs4",
-            "pandas"
+            "--noconfirm",
+            "--distpath", str(dist_dir),
+            "--workpath", str(work_dir),
         ]
+        if force_clean:
+            cmd.append("--clean")
+        cmd.append(str(spec_file))
 
-        for imp in hidden_imports:
-            cmd.extend(["--hidden-import", imp])
-
-        # Add the main script
-        cmd.append(str(main_file := self.project_root / self.main_script))
-
-        if not main_file.exists():
-            raise BuildError(f"Main script not found: {main_file}")
+        # Stream PyInstaller output to disk rather than buffering it through pipes
+        work_dir.mkdir(parents=True, exist_ok=True)
+        log_path = work_dir / f"pyinstaller_{version}.log"
 
         try:
             print(f"   Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            print(f"   📄 Build log: {log_path}")
+            with open(log_path, 'wb') as log_file:
+                subprocess.run(cmd, check=True, stdout=log_file, stderr=subprocess.STDOUT, env=env)
 
-            exe_path = self.dist_dir / f"{exe_name}.exe"
+            exe_path = dist_dir / f"{self.app_name}.exe"
             if exe_path.exists():
                 # Move to releases directory with better name
-                final_path = self.releases_dir / f"{self.app_name}_v{version}.exe"
-                shutil.move(str(exe_path), str(final_path))
-
-                file_size = final_path.stat().st_size / (1024 * 1024)  # MB
+                final_path = self.releases_dir / release_exe_name(version)
+                try:
+                    os.replace(exe_path, final_path)
+                except OSError:
+                    # dist/ and releases/ are on different filesystems, fall back to a copy
+                    _fast_copy(exe_path, final_path)
+                    os.unlink(exe_path)
+
+                # Stat once here; callers reuse the size for release info and upload headers
+                file_size = final_path.stat().st_size
                 print(f"✅ Build completed successfully!")
                 print(f"   📦 Executable: {final_path}")
-                print(f"   📏 Size: {file_size:.1f} MB")
-                return final_path
+                print(f"   📏 Size: {file_size / (1024 * 1024):.1f} MB")
+                return final_path, file_size
             else:
                 raise BuildError("Executable not found after build")
 
         except subprocess.CalledProcessError as e:
-            print(f"❌ PyInstaller failed:")
-            print(f"   Output: {e.stdout}")
-            print(f"   Error: {e.stderr}")
+            print(f"❌ PyInstaller failed, last lines of {log_path}:")
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as log_file:
+                for line in deque(log_file, maxlen=200):
+                    print(f"   {line.rstrip()}")
             raise BuildError(f"PyInstaller failed: {e}")
 
+    def compress_executable(self, exe_path: Path, file_size: int) -> Optional[Path]:
+        """Write a zstd-compressed copy of the executable next to it for a smaller upload"""
+        try:
+            import zstandard
+        except ImportError:
+            print("⚠️  zstandard not installed, skipping compressed asset (pip install zstandard)")
+            return None
+
+        compressed_path = exe_path.with_name(exe_path.name + ".zst")
+        print(f"🗜️  Compressing executable to {compressed_path.name}...")
+
+        compressor = zstandard.ZstdCompressor(level=19, threads=-1)
+        with open(exe_path, 'rb') as fin, open(compressed_path, 'wb') as fout:
+            compressor.copy_stream(fin, fout, size=file_size)
+
+        ratio = file_size / max(1, compressed_path.stat().st_size)
+        print(f"✅ Compressed asset ready ({ratio:.2f}x smaller)")
+        return compressed_path
+
     def test_github_connection(self) -> bool:
         """Test GitHub API connection and permissions"""
         print("🔍 Testing GitHub connection...")
@@ -171,16 +479,16 @@ class TennisScraperBuilder:
             print("❌ No GitHub token provided")
             return False
 
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "ITF-Tennis-Scraper-Builder"
-        }
-
         try:
-            # Test basic API access
+            # The user and repository checks are independent, so issue them together
             print("   Testing API access...")
-            response = requests.get("https://api.github.com/user", headers=headers, timeout=10)
+            print(f"   Testing repository access: {self.github_repo}")
+            repo_url = f"https://api.github.com/repos/{self.github_repo}"
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                user_future = executor.submit(self.http.get, "https://api.github.com/user", timeout=10)
+                repo_future = executor.submit(self.http.get, repo_url, timeout=10)
+                response, repo_response = user_future.result(), repo_future.result()
+
             print(f"   API Response: {response.status_code}")
 
             if response.status_code == 200:
@@ -190,10 +498,7 @@ class TennisScraperBuilder:
                 print(f"   ❌ API access failed: {response.text}")
                 return False
 
-            # Test repository access
-            print(f"   Testing repository access: {self.github_repo}")
-            repo_url = f"https://api.github.com/repos/{self.github_repo}"
-            response = requests.get(repo_url, headers=headers, timeout=10)
+            response = repo_response
             print(f"   Repo Response: {response.status_code}")
 
             if response.status_code == 200:
@@ -211,45 +516,64 @@ class TennisScraperBuilder:
 
     def create_git_tag(self, version: str) -> bool:
         """Create and push git tag"""
+        tag = f'v{version}'
         try:
-            print(f"📝 Creating git tag v{version}...")
-
-            # Check if we're in a git repository
-            result = subprocess.run(['git', 'status'], capture_output=True, text=True, check=False)
-            if result.returncode != 0:
-                print(f"   ⚠️ Not in a git repository: {result.stderr}")
-                return True  # Continue anyway
-
-            # Create tag locally
-            result = subprocess.run(['git', 'tag', f'v{version}'], capture_output=True, text=True, check=False)
-            if result.returncode != 0 and "already exists" not in result.stderr:
-                print(f"   ⚠️ Could not create tag locally: {result.stderr}")
-
-            # Push tag to GitHub
-            result = subprocess.run(['git', 'push', 'origin', f'v{version}'], capture_output=True, text=True,
-                                    check=False)
+            print(f"📝 Creating git tag {tag}...")
+
+            if os.name == 'posix' and shutil.which('bash'):
+                # One process for the whole check/tag/push sequence instead of a fork per step
+                result = subprocess.run(['bash', '-c', _GIT_TAG_SCRIPT, 'bash', tag],
+                                        capture_output=True, text=True, check=False)
+                if result.returncode == _GIT_NOT_A_REPO:
+                    print(f"   ⚠️ Not in a git repository: {result.stderr}")
+                    return True  # Continue anyway
+            else:
+                git = self._git_executable()
+
+                # Check if we're in a git repository
+                # rev-parse answers without walking the working tree like `git status` does
+                result = subprocess.run([git, 'rev-parse', '--is-inside-work-tree'],
+                                        capture_output=True, text=True, check=False)
+                if result.returncode != 0:
+                    print(f"   ⚠️ Not in a git repository: {result.stderr}")
+                    return True  # Continue anyway
+
+                # Create tag locally
+                result = subprocess.run([git, 'tag', tag], capture_output=True, text=True, check=False)
+                if result.returncode != 0 and "already exists" not in result.stderr:
+                    print(f"   ⚠️ Could not create tag locally: {result.stderr}")
+
+                # Push tag to GitHub
+                result = subprocess.run([git, 'push', 'origin', tag], capture_output=True, text=True,
+                                        check=False)
+
             if result.returncode == 0:
-                print(f"✅ Git tag v{version} created and pushed")
+                print(f"✅ Git tag {tag} created and pushed")
                 return True
             else:
-                print(f"   ⚠️ Could not push tag: {result.stderr}")
-                return True  # Continue anyway
+                print(f"   ❌ Could not push tag: {result.stderr}")
+                return False
 
         except Exception as e:
-            print(f"   ⚠️ Git tag creation failed: {e}")
-            return True  # Continue anyway
+            print(f"   ❌ Git tag creation failed: {e}")
+            return False
 
-    def create_github_release(self, version: str, changelog: str, exe_path: Path) -> bool:
-        """Create a GitHub release and upload the executable"""
+    def _git_executable(self) -> str:
+        """Absolute path to git, resolved once so each call skips the PATH search"""
+        if self._git is None:
+            self._git = shutil.which('git') or 'git'
+        return self._git
+
+    def create_github_release(self, version: str, changelog: str, exe_path: Path,
+                              file_size: int,
+                              extra_assets: Optional[list] = None) -> bool:
+        """Create a GitHub release and upload the executable plus any extra assets"""
         print("🚀 Creating GitHub release...")
 
         if not self.test_github_connection():
             print("❌ GitHub connection test failed")
             return False
 
-        # Create git tag first
-        self.create_git_tag(version)
-
         # Release data
         release_data = {
             "tag_name": f"v{version}",
@@ -260,20 +584,14 @@ class TennisScraperBuilder:
             "prerelease": False
         }
 
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "ITF-Tennis-Scraper-Builder"
-        }
-
         try:
             # Create the release
             print(f"   Creating release for {self.github_repo}...")
-            print(f"   📦 Release data: {json.dumps(release_data, indent=2)}")
+            if self.debug:
+                print(f"   📦 Release data: {json.dumps(release_data, indent=2)}")
 
-            response = requests.post(
+            response = self.http.post(
                 f"https://api.github.com/repos/{self.github_repo}/releases",
-                headers=headers,
                 json=release_data,
                 timeout=30
             )
@@ -283,55 +601,109 @@ class TennisScraperBuilder:
             if response.status_code == 201:
                 release_info = response.json()
                 print(f"✅ GitHub release created!")
-                print(f"   🔗 URL: {release_info['html_url']}")
-                print(f"   🆔 Release ID: {release_info['id']}")
-
-                # Upload the executable
-                return self._upload_asset_to_release(release_info, exe_path, headers)
             else:
-                print(f"❌ Failed to create GitHub release:")
-                print(f"   Status: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return False
+                # 422 means the release already exists, e.g. a previous run died mid-upload
+                release_info = None
+                if response.status_code == 422:
+                    release_info = self._get_release_by_tag(f"v{version}")
+
+                if release_info is None:
+                    print(f"❌ Failed to create GitHub release:")
+                    print(f"   Status: {response.status_code}")
+                    print(f"   Response: {response.text}")
+                    return False
+                print(f"♻️  Release v{version} already exists, resuming uploads")
+
+            print(f"   🔗 URL: {release_info['html_url']}")
+            print(f"   🆔 Release ID: {release_info['id']}")
+
+            # Upload the executable plus any extra assets (e.g. the compressed copy)
+            assets = [(exe_path, file_size)] + [(path, path.stat().st_size) for path in extra_assets or []]
+            return self._upload_missing_assets(release_info, assets)
 
         except Exception as e:
             print(f"❌ GitHub API error: {e}")
             return False
 
-    def _upload_asset_to_release(self, release_info: dict, exe_path: Path, headers: dict) -> bool:
+    def _get_release_by_tag(self, tag: str) -> Optional[dict]:
+        """Fetch an existing release by its tag, or None if there isn't one"""
+        response = self.http.get(
+            f"https://api.github.com/repos/{self.github_repo}/releases/tags/{tag}",
+            timeout=10
+        )
+        return response.json() if response.status_code == 200 else None
+
+    def _upload_missing_assets(self, release_info: dict, assets: List[Tuple[Path, int]]) -> bool:
+        """Upload the assets the release doesn't have yet, at most two at a time"""
+        existing = {asset['name']: asset for asset in release_info.get('assets', [])}
+
+        pending = []
+        for asset_path, asset_size in assets:
+            asset = existing.get(asset_path.name)
+            if asset and asset.get('state') == 'uploaded' and asset.get('size') == asset_size:
+                print(f"⏭️  {asset_path.name} already uploaded, skipping")
+                continue
+            if asset:
+                # Left over from an interrupted upload; GitHub rejects a second asset with the same name
+                print(f"🧹 Removing incomplete asset {asset_path.name}")
+                response = self.http.delete(asset['url'], timeout=30)
+                if response.status_code not in (204, 404):  # 404: already gone
+                    print(f"❌ Could not remove incomplete asset {asset_path.name} "
+                          f"({response.status_code}): {response.text}")
+                    print("   Delete it from the release page on GitHub, then run the upload again")
+                    return False
+            pending.append((asset_path, asset_size))
+
+        if not pending:
+            return True
+
+        # GitHub throttles heavily parallel uploads, so keep to a couple of streams
+        with ThreadPoolExecutor(max_workers=min(2, len(pending))) as executor:
+            results = list(executor.map(
+                lambda asset: self._upload_asset_to_release(release_info, *asset), pending
+            ))
+        return all(results)
+
+    def _upload_asset_to_release(self, release_info: dict, exe_path: Path,
+                                 file_size: Optional[int] = None) -> bool:
         """Upload executable to GitHub release"""
+        import requests
+
+        if file_size is None:
+            file_size = exe_path.stat().st_size
+
         print("📤 Uploading executable to GitHub...")
         print(f"   📁 File: {exe_path}")
-        print(f"   📏 Size: {exe_path.stat().st_size / (1024 * 1024):.1f} MB")
+        print(f"   📏 Size: {file_size / (1024 * 1024):.1f} MB")
 
         upload_url = release_info['upload_url'].replace('{?name,label}', '')
-        final_upload_url = f"{upload_url}?name={exe_path.name}"
 
-        print(f"   🔗 Upload URL: {final_upload_url}")
+        print(f"   🔗 Upload URL: {upload_url}")
 
         try:
             # Prepare upload headers
-            upload_headers = headers.copy()
-            upload_headers['Content-Type'] = 'application/octet-stream'
+            upload_headers = {**self._upload_headers, 'Content-Length': str(file_size)}
 
-            print(f"   📋 Upload headers: {list(upload_headers.keys())}")
+            if self.debug:
+                print(f"   📋 Upload headers: {list(upload_headers.keys())}")
 
-            # Read file and upload
+            # Stream the file straight from disk instead of buffering it in memory
             with open(exe_path, 'rb') as f:
-                file_data = f.read()
-                print(f"   📖 Read {len(file_data)} bytes from file")
-
                 print("   🚀 Starting upload...")
-                upload_response = requests.post(
-                    final_upload_url,
+                body = _HashingReader(f, file_size)
+                upload_response = self.http.post(
+                    upload_url,
                     headers=upload_headers,
-                    data=file_data,
-                    timeout=600  # 10 minutes for large files
+                    params={'name': exe_path.name},  # let requests percent-encode the name
+                    data=body,
+                    timeout=(10, 300)  # fail fast on connect, allow slow transfers
                 )
 
             print(f"   📊 Upload response: {upload_response.status_code}")
 
             if upload_response.status_code == 201:
+                # Hashed on the way out, so release info doesn't need to read the file again
+                self._uploaded_digests[exe_path.name] = body.digest.hexdigest()
                 asset_info = upload_response.json()
                 print("✅ Executable uploaded successfully!")
                 print(f"   📦 Download URL: {asset_info['browser_download_url']}")
@@ -360,7 +732,22 @@ class TennisScraperBuilder:
             print(f"❌ Upload error: {e}")
             return False
 
-    def create_release_info(self, version: str, changelog: str, exe_path: Path) -> dict:
+    def _compute_sha256(self, file_path: Path) -> str:
+        """Compute the SHA-256 hex digest of a file without loading it into memory"""
+        if file_path.name in self._uploaded_digests:
+            return self._uploaded_digests[file_path.name]
+
+        with open(file_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+            digest = hashlib.sha256()
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    def create_release_info(self, version: str, changelog: str, exe_path: Path, file_size: int,
+                            compressed_path: Optional[Path] = None) -> dict:
         """Create release information JSON"""
         release_info = {
             "version": version,
@@ -369,62 +756,93 @@ class TennisScraperBuilder:
             "critical": False,
             "min_version": "1.0.0",
             "file_name": exe_path.name,
-            "file_size": exe_path.stat().st_size,
+            "file_size": file_size,
+            "sha256": self._compute_sha256(exe_path),
             "download_url": f"https://github.com/{self.github_repo}/releases/download/v{version}/{exe_path.name}"
         }
 
+        if compressed_path:
+            release_info["compressed_asset"] = {
+                "file_name": compressed_path.name,
+                "file_size": compressed_path.stat().st_size,
+                "sha256": self._compute_sha256(compressed_path),
+                "download_url": f"https://github.com/{self.github_repo}/releases/download/v{version}/{compressed_path.name}"
+            }
+
         # Save release info
         info_file = self.releases_dir / f"update_info_v{version}.json"
 
-        with open(info_file, 'w', encoding='utf-8') as f:
-            json.dump(release_info, f, indent=2)
+        try:
+            import orjson
+            info_file.write_bytes(orjson.dumps(release_info, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        except ImportError:
+            with open(info_file, 'w', encoding='utf-8') as f:
+                json.dump(release_info, f, indent=2, sort_keys=True, ensure_ascii=False)
 
         print(f"📋 Release info saved: {info_file}")
         return release_info
 
-    def build_and_deploy(self, version: str, changelog: str, deploy_to_github: bool = True) -> bool:
+    def build_and_deploy(self, version: str, changelog: str, deploy_to_github: bool = True,
+                         force_clean: bool = False) -> bool:
         """Complete build and deploy process"""
         print(f"🚀 Starting build and deploy process for version {version}")
         print("=" * 70)
 
+        tag_executor = None
         try:
             # Step 1: Clean build directories
-            self.clean_build_dirs()
+            self.clean_build_dirs(include_work_dir=force_clean)
 
             # Step 2: Update version in code
             self.update_version_in_code(version)
 
             # Step 3: Build executable
-            exe_path = self.build_executable(version)
+            exe_path, file_size = self.build_executable(version, force_clean=force_clean)
+
+            # Tag only once the exe exists; the git round trip overlaps the compression
+            if deploy_to_github:
+                tag_executor = ThreadPoolExecutor(max_workers=1)
+                tag_future = tag_executor.submit(self.create_git_tag, version)
 
-            # Step 4: Create update info
-            self.create_release_info(version, changelog, exe_path)
+            compressed_path = self.compress_executable(exe_path, file_size)
 
-            # Step 5: Deploy to GitHub (optional)
+            # Step 4: Deploy to GitHub (optional)
+            success = True
             if deploy_to_github:
-                success = self.create_github_release(version, changelog, exe_path)
-                if success:
-                    print("")
-                    print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
-                    print(f"   📱 Your clients will automatically be notified of version {version}")
-                    print(f"   📥 They can update with one click!")
-                    return True
+                # The release must reference a pushed tag
+                if not tag_future.result():
+                    print(f"❌ Tag v{version} was not pushed; skipping the GitHub release")
+                    success = False
                 else:
-                    print("")
-                    print("⚠️  GitHub deployment failed, but executable is ready")
-                    print(f"   📦 Executable location: {exe_path}")
-                    print("   You can manually upload it to GitHub releases")
-                    print("")
-                    print("🔍 DEBUG SUGGESTIONS:")
-                    print("   1. Check your GitHub token has 'repo' permissions")
-                    print("   2. Verify the repository name is correct")
-                    print("   3. Try running: python upload_helper.py for manual upload")
-                    return False
-            else:
+                    success = self.create_github_release(version, changelog, exe_path,
+                                                         file_size=file_size,
+                                                         extra_assets=[compressed_path] if compressed_path else None)
+
+            # Step 5: Create update info (after the upload, which already hashed the assets)
+            self.create_release_info(version, changelog, exe_path, file_size, compressed_path)
+
+            if not deploy_to_github:
                 print("")
                 print("📦 Build completed. Executable ready for manual deployment.")
                 print(f"   📦 Location: {exe_path}")
                 return True
+            elif success:
+                print("")
+                print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
+                print(f"   📱 Your clients will automatically be notified of version {version}")
+                print(f"   📥 They can update with one click!")
+                return True
+            else:
+                print("")
+                print("⚠️  GitHub deployment failed, but executable is ready")
+                print(f"   📦 Executable location: {exe_path}")
+                print("   You can manually upload it to GitHub releases")
+                print("")
+                print("🔍 DEBUG SUGGESTIONS:")
+                print("   1. Check your GitHub token has 'repo' permissions")
+                print("   2. Verify the repository name is correct")
+                print("   3. Try running: python upload_helper.py for manual upload")
+                return False
 
         except Exception as e:
             print(f"❌ BUILD FAILED: {e}")
@@ -432,12 +850,47 @@ class TennisScraperBuilder:
             print(f"🔍 Full traceback:")
             traceback.print_exc()
             return False
+        finally:
+            if tag_executor is not None:
+                tag_executor.shutdown(wait=True)
+            self.close()
+
+    def build_many(self, releases: List[Tuple[str, str]], force_clean: bool = False) -> bool:
+        """Build several versions side by side without deploying them"""
+        print(f"🚀 Building {len(releases)} versions in parallel")
+        print("=" * 70)
+
+        try:
+            self.clean_build_dirs(include_work_dir=force_clean)
+
+            # PyInstaller runs in subprocesses, so threads are enough to keep them all busy
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(releases))) as executor:
+                builds = list(executor.map(
+                    lambda release: self.build_executable(
+                        release[0], force_clean=force_clean,
+                        workspace=self.build_dir / f"v{release[0]}"
+                    ),
+                    releases
+                ))
+
+            for (version, changelog), (exe_path, file_size) in zip(releases, builds):
+                compressed_path = self.compress_executable(exe_path, file_size)
+                self.create_release_info(version, changelog, exe_path, file_size, compressed_path)
+
+            print("")
+            print(f"📦 Built {len(builds)} executables in {self.releases_dir}")
+            return True
+
+        except Exception as e:
+            print(f"❌ BUILD FAILED: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
 
 
 def validate_version(version: str) -> bool:
     """Validate version format"""
-    import re
-    return bool(re.match(r'^\d+\.\d+\.\d+$', version))
+    return _VERSION_RE.match(version) is not None
 
 
 def main():
@@ -452,6 +905,7 @@ Examples:
 Environment Variables:
   GITHUB_TOKEN    Your GitHub personal access token
   GITHUB_REPO     Your repository name (default: carpsesdema/itf-tennis-scraper)
+  DEBUG_BUILD     Set to print full release payloads and upload headers
 
 Debug Features:
   - Enhanced GitHub API testing
@@ -461,24 +915,26 @@ Debug Features:
         """
     )
 
-    parser.add_argument('--version', required=True,
-                        help='Version number (e.g., 1.0.1)')
+    parser.add_argument('--version', required=True, nargs='+',
+                        help='Version number (e.g., 1.0.1); several build in parallel with --no-github')
     parser.add_argument('--changelog', required=True,
                         help='Changelog description')
     parser.add_argument('--no-github', action='store_true',
                         help='Skip GitHub deployment')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker threads for parallel build steps (default: CPU count)')
+    parser.add_argument('--force-clean', '--clean-build', dest='force_clean', action='store_true',
+                        help='Discard PyInstaller\'s cached analysis and rebuild from scratch')
 
     args = parser.parse_args()
 
     # Validate version format
-    if not validate_version(args.version):
+    if not all(validate_version(version) for version in args.version):
         print("❌ Version must be in format X.Y.Z (e.g., 1.0.1)")
         sys.exit(1)
 
-    # Check for required files
-    if not Path('tennis_scraper.py').exists():
-        print("❌ tennis_scraper.py not found in current directory")
-        print("   Make sure you're running this script from your project root")
+    if len(args.version) > 1 and not args.no_github:
+        print("❌ Building several versions at once requires --no-github")
         sys.exit(1)
 
     print("🔍 ENVIRONMENT CHECK:")
@@ -488,13 +944,26 @@ Debug Features:
     print(f"   GitHub Repo: {os.getenv('GITHUB_REPO', 'carpsesdema/itf-tennis-scraper')}")
     print("")
 
-    builder = TennisScraperBuilder()
+    builder = TennisScraperBuilder(jobs=args.jobs)
 
-    success = builder.build_and_deploy(
-        version=args.version,
-        changelog=args.changelog,
-        deploy_to_github=not args.no_github
-    )
+    # Check for required files
+    if builder.main_script not in builder._root_files:
+        print(f"❌ {builder.main_script} not found in current directory")
+        print("   Make sure you're running this script from your project root")
+        sys.exit(1)
+
+    if len(args.version) > 1:
+        success = builder.build_many(
+            [(version, args.changelog) for version in args.version],
+            force_clean=args.force_clean
+        )
+    else:
+        success = builder.build_and_deploy(
+            version=args.version[0],
+            changelog=args.changelog,
+            deploy_to_github=not args.no_github,
+            force_clean=args.force_clean
+        )
 
     if success:
         print("\n🎉 SUCCESS! Your update system is ready!")
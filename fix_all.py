@@ -4,6 +4,7 @@ Automatic fix script for ITF Tennis Scraper issues.
 """
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 
 def fix_file(file_path, changes):
@@ -14,18 +15,21 @@ def fix_file(file_path, changes):
         return False
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Work on raw bytes to skip the decode/encode round trip
+        content = file_path.read_bytes()
 
-        original_content = content
+        # Match the file's line endings, as text mode used to on Windows
+        newline = b"\r\n" if b"\r\n" in content else b"\n"
 
+        changed = False
         for old, new in changes:
+            old = old.encode('utf-8').replace(b"\n", newline)
             if old in content:
-                content = content.replace(old, new)
+                content = content.replace(old, new.encode('utf-8').replace(b"\n", newline))
+                changed = True
 
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        if changed:
+            file_path.write_bytes(content)
             print(f"✅ Fixed: {file_path}")
             return True
         else:
@@ -101,10 +105,10 @@ def main():
         ]
     }
 
-    fixed_count = 0
-    for file_path, changes in fixes.items():
-        if fix_file(file_path, changes):
-            fixed_count += 1
+    # Each fix touches a different file, so they can run side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(fixes))) as executor:
+        results = list(executor.map(lambda item: fix_file(*item), fixes.items()))
+    fixed_count = sum(results)
 
     print(f"\n🎉 Fixed {fixed_count} files!")
     print("\nNow try: python main.py")
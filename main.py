@@ -8,6 +8,7 @@ It initializes the application with proper configuration and error handling.
 """
 
 import sys
+import json
 import logging
 import os
 import subprocess
@@ -21,7 +22,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 try:
-    from tennis_scraper.app import TennisScraperApp
+    # The GUI (and with it PySide6 and the scrapers) is imported in main(), after browser setup
     from tennis_scraper.config import Config
     from tennis_scraper.utils.logging import setup_logging
 except ImportError as e:
@@ -31,6 +32,65 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Browser found on a previous launch, next to the configuration file
+BROWSER_LOCK_FILE = Config.get_config_dir() / "browser.lock"
+
+# System Chrome/Chromium locations, most common first; resolved once at import
+CHROME_CANDIDATES = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv('USERNAME', '')),
+    "/usr/bin/google-chrome",
+    "/usr/bin/chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+)
+
+# Chromium executable inside a Playwright "chromium-<revision>" directory, per platform
+CHROMIUM_EXECUTABLES = (
+    os.path.join("chrome-win", "chrome.exe"),
+    os.path.join("chrome-linux", "chrome"),
+    os.path.join("chrome-mac", "Chromium.app", "Contents", "MacOS", "Chromium")
+)
+
+# The packaged app is windowed, so child processes would otherwise get their own conhost.exe
+NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+
+def _load_cached_browser() -> bool:
+    """Reuse the browser found on a previous launch if it is still the same file."""
+    try:
+        cached = json.loads(BROWSER_LOCK_FILE.read_text(encoding="utf-8"))
+        stat = os.stat(cached["chrome"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+    if (cached.get("version") != CURRENT_VERSION
+            or stat.st_size != cached.get("size") or stat.st_mtime != cached.get("mtime")):
+        return False
+
+    if cached.get("browsers_path"):
+        os.environ['PLAYWRIGHT_BROWSERS_PATH'] = cached["browsers_path"]
+    os.environ['PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH'] = cached["chrome"]
+    print(f"✅ Using cached browser: {cached['chrome']}")
+    return True
+
+
+def _save_cached_browser(chrome_path: str, browsers_path: str = None):
+    """Remember the discovered browser so the next launch can skip probing."""
+    try:
+        stat = os.stat(chrome_path)
+        BROWSER_LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BROWSER_LOCK_FILE.write_text(json.dumps({
+            "chrome": chrome_path,
+            "browsers_path": browsers_path,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "version": CURRENT_VERSION,
+        }), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️ Could not cache browser location: {e}")
+
+
 def setup_playwright_for_packaged_app():
     """Setup Playwright browsers for packaged application with detailed logging."""
     is_packaged = getattr(sys, 'frozen', False)
@@ -39,9 +99,25 @@ def setup_playwright_for_packaged_app():
         print("🔧 Running in development mode - Playwright should work normally")
         return True
 
+    logger = logging.getLogger(__name__)
     print("🎭 PACKAGED APP DETECTED - Setting up Playwright browsers...")
-    print(f"📁 Executable path: {sys.executable}")
-    print(f"📁 Current working directory: {os.getcwd()}")
+    # Diagnostics go to the debug log: at the default level they cost nothing on every launch
+    logger.debug(f"📁 Executable path: {sys.executable}")
+    logger.debug(f"📁 Current working directory: {os.getcwd()}")
+
+    # Browser chosen by the user (shell, .env, CI): trust it and skip all detection
+    chromium_override = os.environ.get('PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH')
+    if chromium_override and os.path.exists(chromium_override):
+        print(f"✅ Using PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH: {chromium_override}")
+        return True
+    browsers_override = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if browsers_override and os.path.isdir(browsers_override):
+        print(f"✅ Using PLAYWRIGHT_BROWSERS_PATH: {browsers_override}")
+        return True
+
+    # A previous launch already found a working browser: skip all probing
+    if _load_cached_browser():
+        return True
 
     try:
         # First, let's test if Playwright can be imported
@@ -53,46 +129,27 @@ def setup_playwright_for_packaged_app():
             return False
 
         # Check if we're in PyInstaller bundle
-        if hasattr(sys, '_MEIPASS'):
+        if hasattr(sys, '_MEIPASS') and logger.isEnabledFor(logging.DEBUG):
             bundle_dir = Path(sys._MEIPASS)
-            print(f"📦 PyInstaller bundle directory: {bundle_dir}")
+            logger.debug(f"📦 PyInstaller bundle directory: {bundle_dir}")
 
             # List contents to see what's included
-            print("📂 Bundle contents:")
             try:
-                for item in bundle_dir.iterdir():
-                    if item.is_dir():
-                        print(f"  📁 {item.name}/")
-                    else:
-                        print(f"  📄 {item.name}")
-            except Exception as e:
-                print(f"⚠️ Cannot list bundle contents: {e}")
+                with os.scandir(bundle_dir) as entries:
+                    logger.debug("📂 Bundle contents: " + ", ".join(
+                        f"{entry.name}/" if entry.is_dir() else entry.name for entry in entries))
+            except OSError as e:
+                logger.debug(f"⚠️ Cannot list bundle contents: {e}")
 
         # Check for system Chrome/Chromium first (most reliable for packaged apps)
         print("🔍 Checking for system Chrome/Chromium...")
-        chrome_paths = [
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv('USERNAME', '')),
-            "/usr/bin/google-chrome",
-            "/usr/bin/chromium-browser",
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-        ]
-
-        for chrome_path in chrome_paths:
+        # An existing binary is trusted as is; launching it for --version costs a process spawn
+        for chrome_path in CHROME_CANDIDATES:
             if os.path.exists(chrome_path):
                 print(f"✅ Found system Chrome: {chrome_path}")
                 os.environ['PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH'] = chrome_path
-
-                # Test if Chrome works
-                try:
-                    result = subprocess.run([chrome_path, "--version"],
-                                            capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        print(f"✅ Chrome version: {result.stdout.strip()}")
-                        return True
-                except Exception as e:
-                    print(f"⚠️ Chrome test failed: {e}")
+                _save_cached_browser(chrome_path)
+                return True
 
         print("❌ No system Chrome found")
 
@@ -118,26 +175,31 @@ def setup_playwright_for_packaged_app():
             ])
 
         for browser_path in possible_paths:
-            print(f"  Checking: {browser_path}")
+            logger.debug(f"  Checking: {browser_path}")
             if browser_path.exists():
                 print(f"✅ Found Playwright browsers at: {browser_path}")
                 os.environ['PLAYWRIGHT_BROWSERS_PATH'] = str(browser_path)
 
-                # Look for Chromium executable
-                chromium_paths = [
-                    browser_path / "chromium-*/chrome-win" / "chrome.exe",
-                    browser_path / "chromium-*/chrome-linux" / "chrome",
-                    browser_path / "chromium-*/chrome-mac" / "Chromium.app/Contents/MacOS/Chromium"
-                ]
-
-                for pattern in chromium_paths:
-                    import glob
-                    matches = glob.glob(str(pattern))
-                    if matches:
-                        chromium_exe = matches[0]
-                        print(f"✅ Found Chromium executable: {chromium_exe}")
-                        os.environ['PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH'] = chromium_exe
-                        return True
+                # Look for Chromium executable with a single pass over the browsers dir
+                # (newest revision first)
+                try:
+                    with os.scandir(browser_path) as entries:
+                        chromium_dirs = sorted(
+                            (entry.path for entry in entries
+                             if entry.name.startswith("chromium-") and entry.is_dir()),
+                            reverse=True
+                        )
+                except OSError:
+                    chromium_dirs = []
+
+                for chromium_dir in chromium_dirs:
+                    for executable in CHROMIUM_EXECUTABLES:
+                        chromium_exe = os.path.join(chromium_dir, executable)
+                        if os.path.exists(chromium_exe):
+                            print(f"✅ Found Chromium executable: {chromium_exe}")
+                            os.environ['PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH'] = chromium_exe
+                            _save_cached_browser(chromium_exe, str(browser_path))
+                            return True
 
         print("❌ No Playwright browsers found")
 
@@ -156,10 +218,11 @@ def setup_playwright_for_packaged_app():
                                     capture_output=True,
                                     text=True,
                                     timeout=180,  # 3 minute timeout
-                                    cwd=str(user_dir.parent))
+                                    cwd=str(user_dir.parent),
+                                    creationflags=NO_WINDOW)
 
-            print(f"📋 Install stdout: {result.stdout}")
-            print(f"📋 Install stderr: {result.stderr}")
+            logger.debug(f"📋 Install stdout: {result.stdout}")
+            logger.debug(f"📋 Install stderr: {result.stderr}")
             print(f"📋 Install return code: {result.returncode}")
 
             if result.returncode == 0:
@@ -245,6 +308,13 @@ def main():
             return 1
 
         # Create and run application
+        try:
+            from tennis_scraper.app import TennisScraperApp
+        except ImportError as e:
+            print(f"Error importing tennis_scraper modules: {e}")
+            print("Please ensure all dependencies are installed: pip install -r requirements.txt")
+            return 1
+
         app = TennisScraperApp(config)
         exit_code = app.run()
 
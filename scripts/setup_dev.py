@@ -141,7 +141,7 @@ def verify_installation(pip_path):
         "PySide6",
         "requests",
         "selenium",
-        "pandas"
+        "openpyxl"
     ]
 
     venv_python = pip_path.parent / ("python.exe" if sys.platform == "win32" else "python")
@@ -18,7 +18,6 @@ def get_info() -> dict:
     }
 
 
-from .core.engine import TennisScrapingEngine
 from .core.interfaces import (DataExporter, EventEmitter, MatchFilter,
                               MatchScraper, Plugin)
 from .core.interfaces import UpdateChecker as CoreUpdateChecker
@@ -44,3 +43,11 @@ __all__ = [
     "Plugin",
     "TennisScrapingEngine",
 ]
+
+
+def __getattr__(name):
+    # The engine pulls in the Playwright scrapers; only import it when it is asked for
+    if name == "TennisScrapingEngine":
+        from .core.engine import TennisScrapingEngine
+        return TennisScrapingEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -43,6 +43,9 @@ class ScrapingConfig:
     flashscore_max_elements_to_check: int = 100  # Limit page elements checked
     flashscore_simplified_processing: bool = True  # Use simplified processing
 
+    # Read matches from Flashscore's data feed first; the browser is only the fallback
+    flashscore_use_feed: bool = True
+
 
 @dataclass
 class UIConfig:
@@ -195,11 +198,15 @@ class Config:
             if hasattr(instance, key):
                 setattr(instance, key, value)
 
+    @staticmethod
+    def get_config_dir() -> Path:
+        """Directory holding the configuration file and other per-user app files."""
+        return Path.home() / ".config" / "tennis_scraper"
+
     @staticmethod
     def get_default_config_path() -> str:
         """Get the default configuration file path."""
-        config_dir = Path.home() / ".config" / "tennis_scraper"
-        return str(config_dir / "slow_computer_config.json")
+        return str(Config.get_config_dir() / "slow_computer_config.json")
 
     def validate(self) -> bool:
         """Validate configuration values with slow computer considerations - AUTO-FIX bad values."""
@@ -257,7 +264,8 @@ class Config:
                 'flashscore_element_timeout': self.scraping.flashscore_element_timeout,
                 'flashscore_max_matches_to_process': self.scraping.flashscore_max_matches_to_process,
                 'flashscore_max_elements_to_check': self.scraping.flashscore_max_elements_to_check,
-                'flashscore_simplified_processing': self.scraping.flashscore_simplified_processing
+                'flashscore_simplified_processing': self.scraping.flashscore_simplified_processing,
+                'flashscore_use_feed': self.scraping.flashscore_use_feed
             })
 
         return base_config
@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional
 
 from .models import TennisMatch, ScrapingResult
 from .interfaces import MatchScraper, MatchFilter
@@ -18,13 +18,25 @@ class TennisScrapingEngine:
         self.scraping_config = config.get('scraping', {})
         self.logger = get_logger(__name__)
         self.scrapers: Dict[str, MatchScraper] = {}
+        # Scrapers dropped by reconfigure; their browser and session are released by the next cleanup(),
+        # which runs in the event loop that opened them
+        self._retired_scrapers: List[MatchScraper] = []
         self.filters: List[MatchFilter] = []
         self.event_listeners: Dict[str, List[Callable]] = {}
         self._init_scrapers()
         self.performance_logger = PerformanceLogger()
 
+    def reconfigure(self, config: Dict[str, Any]):
+        """
+        Apply a new configuration in place. Scrapers that stay enabled are updated rather
+        than recreated, so their sessions survive; listeners and filters are untouched.
+        """
+        self.config_dict = config
+        self.scraping_config = config.get('scraping', {})
+        self._init_scrapers()
+
     def _init_scrapers(self):
-        """Initialize available scrapers based on configuration."""
+        """Initialize available scrapers based on configuration, reusing existing instances."""
         sources_enabled = self.scraping_config.get('sources_enabled', {})
 
         scraper_classes = {
@@ -35,9 +47,16 @@ class TennisScrapingEngine:
         for name, ScraperClass in scraper_classes.items():
             if sources_enabled.get(name, False):
                 cfg_for_scraper = self.scraping_config.copy()
-                self.scrapers[name] = ScraperClass(cfg_for_scraper)
-                self.logger.info(f"Initialized scraper: {name}")
+                if name in self.scrapers:
+                    self.scrapers[name].reconfigure(cfg_for_scraper)
+                    self.logger.info(f"Reconfigured scraper: {name}")
+                else:
+                    self.scrapers[name] = ScraperClass(cfg_for_scraper)
+                    self.logger.info(f"Initialized scraper: {name}")
             else:
+                retired = self.scrapers.pop(name, None)
+                if retired is not None:
+                    self._retired_scrapers.append(retired)
                 self.logger.info(f"Scraper disabled by config: {name}")
 
     def on(self, event_name: str, callback: Callable):
@@ -70,20 +89,17 @@ class TennisScrapingEngine:
         all_scraped_matches: List[TennisMatch] = []
         unique_match_identifiers = set()
 
-        tasks = []
-        for source_name_key, scraper in self.scrapers.items():
-            if await scraper.is_available():
-                self.logger.info(f"Queueing scrape task for {source_name_key}")
-                tasks.append(self._scrape_single_source(scraper))
-            else:
-                actual_scraper_name = await scraper.get_source_name()
-                self.logger.warning(f"Source {actual_scraper_name} is not available, skipping.")
-                self._emit("scraper_unavailable", actual_scraper_name)
-
-
-        results: List[ScrapingResult] = await asyncio.gather(*tasks, return_exceptions=True)
+        # Sources are independent, so each one's availability check and scrape run concurrently
+        tasks = [
+            self._scrape_source_if_available(source_name_key, scraper)
+            for source_name_key, scraper in self.scrapers.items()
+        ]
+        results: List[Optional[ScrapingResult]] = await asyncio.gather(*tasks, return_exceptions=True)
 
         for result in results:
+            if result is None:  # Source was unavailable and has already been reported
+                continue
+
             if isinstance(result, Exception):
                 self.logger.error(f"Exception during scraping gather: {result}", exc_info=True)
                 self._emit("scraping_error", str(result))
@@ -138,6 +154,18 @@ class TennisScrapingEngine:
         self._emit("individual_match_found", match)
 
 
+    async def _scrape_source_if_available(self, source_name_key: str,
+                                          scraper: MatchScraper) -> Optional[ScrapingResult]:
+        """Check a source's availability and scrape it; None if it was unavailable."""
+        if not await scraper.is_available():
+            actual_scraper_name = await scraper.get_source_name()
+            self.logger.warning(f"Source {actual_scraper_name} is not available, skipping.")
+            self._emit("scraper_unavailable", actual_scraper_name)
+            return None
+
+        self.logger.info(f"Starting scrape task for {source_name_key}")
+        return await self._scrape_single_source(scraper)
+
     async def _scrape_single_source(self, scraper: MatchScraper) -> ScrapingResult:
         source_name = await scraper.get_source_name()
         self.logger.info(f"Starting scrape for {source_name}...")
@@ -213,13 +241,17 @@ class TennisScrapingEngine:
     async def cleanup(self):
         """Cleanup resources for all scrapers."""
         self.logger.info("Cleaning up scraper resources...")
-        for scraper in self.scrapers.values():
+        retired, self._retired_scrapers = self._retired_scrapers, []
+        # Closing browsers and sessions is I/O bound, so all scrapers shut down together
+        await asyncio.gather(*(self._cleanup_scraper(scraper) for scraper in [*self.scrapers.values(), *retired]))
+        self.logger.info("Scraper cleanup complete.")
+
+    async def _cleanup_scraper(self, scraper: MatchScraper):
+        try:
+            await scraper.cleanup()
+        except Exception as e:
+            scraper_name = "UnknownScraper"
             try:
-                await scraper.cleanup()
-            except Exception as e:
-                scraper_name = "UnknownScraper"
-                try:
-                    scraper_name = await scraper.get_source_name()
-                except: pass
-                self.logger.error(f"Error during cleanup for {scraper_name}: {e}")
-        self.logger.info("Scraper cleanup complete.")
\ No newline at end of file
+                scraper_name = await scraper.get_source_name()
+            except: pass
+            self.logger.error(f"Error during cleanup for {scraper_name}: {e}")
\ No newline at end of file
@@ -8,11 +8,14 @@ class MatchScraper(ABC):
     """Abstract base class for match scrapers."""
 
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
         from ..utils.logging import get_logger
         self.logger = get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
-        self.delay_between_requests = config.get('delay_between_requests', 1)
+        self.reconfigure(config)
 
+    def reconfigure(self, config: Dict[str, Any]):
+        """Apply new settings in place (override to read more of them)."""
+        self.config = config
+        self.delay_between_requests = config.get('delay_between_requests', 1)
 
     @abstractmethod
     async def get_source_name(self) -> str:
@@ -1,10 +1,14 @@
 """Data models for tennis matches and configuration."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them (3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class MatchStatus(Enum):
     """Match status enumeration."""
@@ -151,7 +155,7 @@ class Score:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TennisMatch:
     """Data model for a tennis match."""
     home_player: Player
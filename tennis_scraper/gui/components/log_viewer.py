@@ -2,66 +2,44 @@
 Log viewer component for displaying application logs.
 """
 
+import logging
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
     QComboBox, QLabel, QCheckBox, QLineEdit, QSpinBox
 )
-from PySide6.QtCore import QTimer, Signal, Qt, QThread
-from PySide6.QtGui import QFont, QTextCursor, QColor
+from PySide6.QtCore import QTimer, Signal, Qt, QObject
+from PySide6.QtGui import QFont, QColor
 
-from ...utils.logging import get_recent_logs, get_log_file_path
+from ...utils.logging import get_recent_logs, DEFAULT_LOG_FORMAT, DEFAULT_DATE_FORMAT
 from ...utils.logging import get_logger
 
 
-class LogMonitorWorker(QThread):
-    """Worker thread for monitoring log file changes."""
+class _LogLineEmitter(QObject):
+    """Carries formatted log lines to the GUI thread."""
 
     new_log_line = Signal(str)
 
-    def __init__(self, log_file_path: str):
-        super().__init__()
-        self.log_file_path = log_file_path
-        self.running = False
-        self.last_position = 0
-
-    def run(self):
-        """Monitor log file for new entries."""
-        import time
-        from pathlib import Path
-
-        self.running = True
-        log_file = Path(self.log_file_path)
-
-        # Get initial file size
-        if log_file.exists():
-            self.last_position = log_file.stat().st_size
-
-        while self.running:
-            try:
-                if log_file.exists():
-                    current_size = log_file.stat().st_size
-
-                    if current_size > self.last_position:
-                        # Read new content
-                        with open(log_file, 'r', encoding='utf-8') as f:
-                            f.seek(self.last_position)
-                            new_content = f.read()
 
-                            for line in new_content.splitlines():
-                                if line.strip():
-                                    self.new_log_line.emit(line)
+class QtLogHandler(logging.Handler):
+    """Logging handler that forwards formatted records to the log viewer via a Qt signal."""
 
-                        self.last_position = current_size
-
-                time.sleep(1)  # Check every second
-
-            except Exception:
-                # Ignore errors and continue monitoring
-                time.sleep(1)
+    def __init__(self):
+        super().__init__()
+        self.emitter = _LogLineEmitter()
+        # Same line format as the log file, so level filtering and colouring still apply
+        file_formatter = next((h.formatter for h in logging.getLogger().handlers if h.formatter), None)
+        self.setFormatter(file_formatter or logging.Formatter(DEFAULT_LOG_FORMAT, DEFAULT_DATE_FORMAT))
 
-    def stop(self):
-        """Stop monitoring."""
-        self.running = False
+    def emit(self, record: logging.LogRecord):
+        try:
+            for line in self.format(record).splitlines():  # Tracebacks arrive one line at a time, as from the file
+                if line.strip():
+                    self.emitter.new_log_line.emit(line)
+        except RuntimeError:
+            pass  # Viewer already destroyed during shutdown
+        except Exception:
+            self.handleError(record)
 
 
 class LogViewer(QWidget):
@@ -70,7 +48,7 @@ class LogViewer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
-        self.monitor_worker = None
+        self.log_handler = None
         self.max_lines = 1000
         self.auto_scroll = True
 
@@ -132,6 +110,8 @@ class LogViewer(QWidget):
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 9))
         self.log_display.setLineWrapMode(QTextEdit.NoWrap)
+        # One block per line; the document drops the oldest lines itself past the limit
+        self.log_display.document().setMaximumBlockCount(self.max_lines)
         layout.addWidget(self.log_display)
 
         # Status
@@ -165,16 +145,21 @@ class LogViewer(QWidget):
             self.status_label.setText("Failed to load logs")
 
     def _start_monitoring(self):
-        """Start monitoring log file for new entries."""
+        """Receive new log records directly from the logging system (no log file polling)."""
         try:
-            log_file_path = get_log_file_path()
-            self.monitor_worker = LogMonitorWorker(log_file_path)
-            self.monitor_worker.new_log_line.connect(self._add_log_line)
-            self.monitor_worker.start()
+            self.log_handler = QtLogHandler()
+            self.log_handler.emitter.new_log_line.connect(self._add_log_line)
+            logging.getLogger().addHandler(self.log_handler)
             self.logger.info("Started log monitoring")
         except Exception as e:
             self.logger.error(f"Failed to start log monitoring: {e}")
 
+    def stop_monitoring(self):
+        """Detach from the logging system."""
+        if self.log_handler:
+            logging.getLogger().removeHandler(self.log_handler)
+            self.log_handler = None
+
     def _add_log_line(self, line: str):
         """Add a new log line to the display."""
         if not self._should_show_line(line):
@@ -183,13 +168,8 @@ class LogViewer(QWidget):
         # Color code based on log level
         colored_line = self._colorize_log_line(line)
 
-        # Add to display
-        cursor = self.log_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertHtml(colored_line + "<br>")
-
-        # Limit number of lines
-        self._enforce_line_limit()
+        # Add to display as its own block, so the maximum block count bounds the document
+        self.log_display.append(colored_line)
 
         # Auto-scroll if enabled
         if self.auto_scroll:
@@ -228,16 +208,6 @@ class LogViewer(QWidget):
         else:
             return line_html
 
-    def _enforce_line_limit(self):
-        """Ensure log display doesn't exceed maximum lines."""
-        document = self.log_display.document()
-        if document.blockCount() > self.max_lines:
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.Start)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor,
-                                document.blockCount() - self.max_lines)
-            cursor.removeSelectedText()
-
     def _apply_filters(self):
         """Reapply filters to existing log content."""
         self._refresh_logs()
@@ -245,7 +215,7 @@ class LogViewer(QWidget):
     def _on_max_lines_changed(self, value: int):
         """Handle max lines change."""
         self.max_lines = value
-        self._enforce_line_limit()
+        self.log_display.document().setMaximumBlockCount(value)
 
     def _on_auto_scroll_toggled(self, enabled: bool):
         """Handle auto-scroll toggle."""
@@ -282,7 +252,5 @@ class LogViewer(QWidget):
 
     def closeEvent(self, event):
         """Handle widget close."""
-        if self.monitor_worker and self.monitor_worker.isRunning():
-            self.monitor_worker.stop()
-            self.monitor_worker.wait(3000)
+        self.stop_monitoring()
         event.accept()
\ No newline at end of file
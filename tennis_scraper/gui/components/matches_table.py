@@ -4,14 +4,63 @@ MatchesTable component for displaying tennis match data with IMPROVED COLORS.
 
 from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 from PySide6.QtCore import Qt, QSettings
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QBrush
 
-from typing import List, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone  # For consistent timezone handling
 
 from ...core.models import TennisMatch, MatchStatus  # Adjusted import path
 from ...utils.logging import get_logger
 
+# (background, foreground) per row kind, created once instead of per row and cell
+TIE_BREAK_COLORS = (QColor(255, 69, 0), QColor(255, 255, 255))  # Orange-red, white text - very noticeable
+STATUS_COLORS = {
+    MatchStatus.LIVE: (QColor(144, 238, 144), QColor(0, 100, 0)),  # Light green, dark green text
+    MatchStatus.FINISHED: (QColor(245, 245, 245), QColor(105, 105, 105)),  # Very light gray, dark gray text
+    MatchStatus.SCHEDULED: (QColor(240, 248, 255), QColor(0, 0, 139)),  # Alice blue, dark blue text
+}
+TIE_BREAK_STYLE = "tie_break"
+MAX_POOLED_ROWS = 100  # Item rows kept from removed matches for reuse by new ones
+STRETCH_COLUMNS = (1, 2, 4)  # Home Player, Away Player, Tournament; the rest are sized to contents once
+
+# A row is identified across refreshes by (source, match id), or (source, home, away, tournament)
+# for matches without an id
+MatchKey = tuple
+
+
+def _match_key(match: TennisMatch) -> MatchKey:
+    if match.match_id:
+        return match.source, match.match_id
+    return match.source, match.home_player.name, match.away_player.name, match.tournament
+
+
+def _match_fingerprint(match: TennisMatch) -> tuple:
+    """Everything the table shows for a match, cheap to build and compare."""
+    return (_match_key(match), match.home_player.country_code, match.away_player.country_code,
+            match.status, match.round_info, match.last_updated, match.metadata.get('is_match_tie_break'),
+            [tuple(s) for s in match.score.sets], match.score.current_game)
+
+
+def _row_style(match: TennisMatch):
+    """Style key for a row: tie-break alert first, otherwise the match status."""
+    return TIE_BREAK_STYLE if match.metadata.get('is_match_tie_break') else match.status
+
+
+@lru_cache(maxsize=2048)
+def _format_last_updated(last_updated: Optional[datetime]) -> str:
+    """Formats a last_updated timestamp; matches from one scrape share it, so it is formatted once."""
+    # Format last_updated timestamp (assuming it's UTC)
+    return last_updated.astimezone().strftime('%H:%M:%S %Z') if last_updated else "N/A"
+
+
+def _row_texts(match: TennisMatch) -> Tuple[str, ...]:
+    """Cell texts for a row, in column order."""
+    last_updated_str = _format_last_updated(match.last_updated)
+    return (match.status.display_name, match.home_player.display_name, match.away_player.display_name,
+            match.display_score, match.tournament, match.round_info, match.source, last_updated_str)
+
 
 class MatchesTable(QTableWidget):
     """
@@ -22,6 +71,13 @@ class MatchesTable(QTableWidget):
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self._matches_data: List[TennisMatch] = []
+        # Rows kept between refreshes; items (not row indices) because sorting moves rows
+        self._last_matches: Dict[MatchKey, TennisMatch] = {}
+        self._row_items: Dict[MatchKey, List[QTableWidgetItem]] = {}
+        self._row_styles: Dict[MatchKey, object] = {}
+        self._free_rows: List[List[QTableWidgetItem]] = []
+        self._columns_sized = False
+        self._last_fingerprint: Optional[List[tuple]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -41,102 +97,142 @@ class MatchesTable(QTableWidget):
         self.verticalHeader().setVisible(False)  # Hide default row numbers
 
         # Column sizing
+        self._apply_default_column_modes()
+
+    def _apply_default_column_modes(self):
+        """Name columns stretch; the others are Interactive, since ResizeToContents re-measures every row on each change."""
         header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Status
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Home Player
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # Away Player
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Score
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)  # Tournament
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Round
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Source
-        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)  # Last Updated
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)  # Status, Score, Round, Source, Last Updated
+        for col_idx in STRETCH_COLUMNS:
+            header.setSectionResizeMode(col_idx, QHeaderView.ResizeMode.Stretch)
 
     def update_matches(self, matches: List[TennisMatch]):
         """
-        Clears and repopulates the table with new match data.
+        Updates the table to show the given matches, touching only rows and cells that changed.
         """
-        self.setSortingEnabled(False)  # Disable sorting during update for performance
-        self.clearContents()
-        self.setRowCount(len(matches))
+        # The end-of-cycle list often repeats what per-match updates already showed
+        fingerprint = [_match_fingerprint(match) for match in matches]
+        if fingerprint == self._last_fingerprint:
+            self.logger.debug(f"Matches table unchanged ({len(matches)} matches), skipping update.")
+            return
+        self._last_fingerprint = fingerprint
+
         self._matches_data = sorted(matches, key=lambda m: (m.status != MatchStatus.LIVE,
                                                             m.scheduled_time or datetime.max.replace(
                                                                 tzinfo=timezone.utc)))  # Show live first, then by time
+        new_matches: Dict[MatchKey, TennisMatch] = {}
+        occurrences = Counter()
+        for match in self._matches_data:
+            key = _match_key(match)
+            occurrences[key] += 1
+            if occurrences[key] > 1:  # Same key without an id to tell them apart: each still gets a row
+                key = (*key, occurrences[key])
+            new_matches[key] = match
+        added = removed = changed = 0
 
-        for row_idx, match in enumerate(self._matches_data):
-            self._populate_row(row_idx, match)
+        # One repaint and no per-cell signals or re-sorting for the whole refresh
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)  # Disable sorting during update for performance
+        try:
+            for key in [key for key in self._row_items if key not in new_matches]:
+                items = self._row_items.pop(key)
+                self._row_styles.pop(key, None)
+                row_idx = self.row(items[0])
+                if len(self._free_rows) < MAX_POOLED_ROWS:
+                    # Take the items out so removeRow doesn't delete them; a new match can reuse them
+                    self._free_rows.append([self.takeItem(row_idx, col_idx) for col_idx in range(len(items))])
+                self.removeRow(row_idx)
+                removed += 1
 
-        self.setSortingEnabled(True)
-        self.logger.info(f"Matches table updated with {len(matches)} matches.")
+            for key, match in new_matches.items():
+                items = self._row_items.get(key)
+                if items is None:
+                    row_idx = self.rowCount()
+                    self.insertRow(row_idx)
+                    self._row_items[key] = self._populate_row(row_idx, match)
+                    self._row_styles[key] = _row_style(match)
+                    added += 1
+                elif self._update_row(key, items, match):
+                    changed += 1
+        finally:
+            self.setSortingEnabled(True)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
-    def _populate_row(self, row_idx: int, match: TennisMatch):
-        """Populates a single row in the table with match data."""
+        # Fit the non-stretch columns to the first real data once; afterwards the user owns the widths
+        if not self._columns_sized and new_matches:
+            for col_idx in range(self.columnCount()):
+                if col_idx not in STRETCH_COLUMNS:
+                    self.resizeColumnToContents(col_idx)
+            self._columns_sized = True
 
-        status_item = QTableWidgetItem(match.status.display_name)
-        home_player_item = QTableWidgetItem(match.home_player.display_name)
-        away_player_item = QTableWidgetItem(match.away_player.display_name)
-        score_item = QTableWidgetItem(match.display_score)
-        tournament_item = QTableWidgetItem(match.tournament)
-        round_item = QTableWidgetItem(match.round_info)
-        source_item = QTableWidgetItem(match.source)
+        self._last_matches = new_matches
+        self._matches_data = list(new_matches.values())
+        self.logger.info(f"Matches table updated with {len(new_matches)} matches "
+                         f"({added} added, {removed} removed, {changed} changed).")
 
-        # Format last_updated timestamp (assuming it's UTC)
-        last_updated_str = match.last_updated.astimezone().strftime('%H:%M:%S %Z') if match.last_updated else "N/A"
-        last_updated_item = QTableWidgetItem(last_updated_str)
+    def _populate_row(self, row_idx: int, match: TennisMatch) -> List[QTableWidgetItem]:
+        """Populates a single row in the table with match data, reusing pooled items when available."""
+        texts = _row_texts(match)
+        style = _row_style(match)
+
+        if self._free_rows:
+            items = self._free_rows.pop()
+            for item, text in zip(items, texts):
+                item.setText(text)
+            self._apply_row_style(items, style)  # Also resets whatever style the previous match had
+        else:
+            items = [QTableWidgetItem(text) for text in texts]
+            # IMPROVED STYLING - Much easier on the eyes! Applied while creating the items.
+            if style == TIE_BREAK_STYLE or style in STATUS_COLORS:
+                self._apply_row_style(items, style)
 
         # Set items in table
-        self.setItem(row_idx, 0, status_item)
-        self.setItem(row_idx, 1, home_player_item)
-        self.setItem(row_idx, 2, away_player_item)
-        self.setItem(row_idx, 3, score_item)
-        self.setItem(row_idx, 4, tournament_item)
-        self.setItem(row_idx, 5, round_item)
-        self.setItem(row_idx, 6, source_item)
-        self.setItem(row_idx, 7, last_updated_item)
-
-        # IMPROVED STYLING - Much easier on the eyes!
-        if match.metadata.get('is_match_tie_break'):
+        for col_idx, item in enumerate(items):
+            self.setItem(row_idx, col_idx, item)
+        return items
+
+    def _update_row(self, key: MatchKey, items: List[QTableWidgetItem], match: TennisMatch) -> bool:
+        """Updates an existing row in place; returns True if anything changed."""
+        changed = False
+        for item, text in zip(items, _row_texts(match)):
+            if item.text() != text:
+                item.setText(text)
+                changed = True
+
+        style = _row_style(match)
+        if style != self._row_styles.get(key):
+            self._apply_row_style(items, style)
+            self._row_styles[key] = style
+            changed = True
+        return changed
+
+    @staticmethod
+    def _apply_row_style(items: List[QTableWidgetItem], style):
+        """Colors a row for its style key; unknown statuses get the default look."""
+        if style == TIE_BREAK_STYLE:
             # BRIGHT ALERT for tie breaks - this is the money maker!
-            tie_break_color = QColor(255, 69, 0)  # Orange-red, very noticeable
-            for col_idx in range(self.columnCount()):
-                item = self.item(row_idx, col_idx)
-                if item:
-                    item.setBackground(tie_break_color)
-                    item.setForeground(QColor(255, 255, 255))  # White text
-                    # Make it bold too
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-        elif match.status == MatchStatus.LIVE:
-            # Subtle green tint for live matches
-            live_color = QColor(144, 238, 144)  # Light green
-            for col_idx in range(self.columnCount()):
-                item = self.item(row_idx, col_idx)
-                if item:
-                    item.setBackground(live_color)
-                    item.setForeground(QColor(0, 100, 0))  # Dark green text
-        elif match.status == MatchStatus.FINISHED:
-            # Light gray for finished matches
-            finished_color = QColor(245, 245, 245)  # Very light gray
-            for col_idx in range(self.columnCount()):
-                item = self.item(row_idx, col_idx)
-                if item:
-                    item.setBackground(finished_color)
-                    item.setForeground(QColor(105, 105, 105))  # Dark gray text
-        elif match.status == MatchStatus.SCHEDULED:
-            # Very subtle blue tint for scheduled matches
-            scheduled_color = QColor(240, 248, 255)  # Alice blue - barely noticeable
-            for col_idx in range(self.columnCount()):
-                item = self.item(row_idx, col_idx)
-                if item:
-                    item.setBackground(scheduled_color)
-                    item.setForeground(QColor(0, 0, 139))  # Dark blue text
-        # Default (no special coloring) for other statuses
+            background, foreground = TIE_BREAK_COLORS
+        else:
+            # Default (no special coloring) for other statuses
+            background, foreground = STATUS_COLORS.get(style, (QBrush(), QBrush()))
+
+        font = items[0].font()
+        font.setBold(style == TIE_BREAK_STYLE)
+        for item in items:
+            item.setBackground(background)
+            item.setForeground(foreground)
+            item.setFont(font)
 
     def get_selected_match(self) -> Optional[TennisMatch]:
         """Returns the TennisMatch object for the currently selected row."""
-        current_row = self.currentRow()
-        if 0 <= current_row < len(self._matches_data):
-            return self._matches_data[current_row]
+        current_item = self.item(self.currentRow(), 0)
+        if current_item is None:
+            return None
+        for key, items in self._row_items.items():
+            if items[0] is current_item:
+                return self._last_matches.get(key)
         return None
 
     def get_matches(self) -> List[TennisMatch]:
@@ -145,7 +241,7 @@ class MatchesTable(QTableWidget):
 
     def get_match_count(self) -> int:
         """Returns the number of matches currently displayed."""
-        return len(self._matches_data)
+        return len(self._last_matches)
 
     def save_settings(self, settings: QSettings):
         """Save table settings (e.g., column widths, sort order)."""
@@ -157,10 +253,10 @@ class MatchesTable(QTableWidget):
         column_states = settings.value("matchesTable/columnStates")
         if column_states:
             self.horizontalHeader().restoreState(column_states)
+            # Saved widths are kept as they are; older saved states may still carry ResizeToContents modes
+            self._apply_default_column_modes()
+            self._columns_sized = True
             self.logger.debug("MatchesTable settings loaded.")
         else:
             # Apply default resize mode if no saved state
-            self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-            self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-            self.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-            self.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
\ No newline at end of file
+            self._apply_default_column_modes()
\ No newline at end of file
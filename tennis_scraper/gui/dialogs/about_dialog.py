@@ -143,9 +143,8 @@ class AboutDialog(QDialog):
 <ul>
 <li><strong>PySide6:</strong> Cross-platform GUI framework</li>
 <li><strong>Selenium:</strong> Web browser automation</li>
-<li><strong>BeautifulSoup:</strong> HTML parsing and extraction</li>
 <li><strong>aiohttp:</strong> Asynchronous HTTP client</li>
-<li><strong>pandas:</strong> Data analysis and manipulation</li>
+<li><strong>openpyxl:</strong> Excel export</li>
 <li><strong>requests:</strong> HTTP library for Python</li>
 </ul>
 
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QProgressBar, QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, QThread, QTimer
 from PySide6.QtGui import QFont, QPixmap
 
 from ...updates.checker import UpdateInfo # Ensure UpdateInfo is imported
@@ -16,12 +16,15 @@ class UpdateDialog(QDialog):
     """Dialog for showing update information and handling downloads."""
 
     install_requested = Signal(str)
+    PROGRESS_POLL_MS = 100  # Progress bar refresh rate while downloading, independent of chunk arrival
 
     def __init__(self, update_info_obj: UpdateInfo, parent=None): # EXPECT UpdateInfo OBJECT
         super().__init__(parent)
         self.update_info = update_info_obj # ASSIGN OBJECT DIRECTLY
         self.logger = get_logger(__name__)
         self.update_worker = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(self.PROGRESS_POLL_MS)
 
         self._init_ui()
         self._connect_signals()
@@ -106,6 +109,7 @@ class UpdateDialog(QDialog):
 
     def _connect_signals(self):
         self.download_btn.clicked.connect(self._start_download)
+        self.progress_timer.timeout.connect(self._poll_download_progress)
         self.later_btn.clicked.connect(self.close)
         self.skip_btn.clicked.connect(self._skip_version)
 
@@ -123,16 +127,42 @@ class UpdateDialog(QDialog):
             self.logger.warning("MainWindow config or updates attribute not found, using default for UpdateWorker.")
             update_cfg_dict = {"github_repo": "carpsesdema/itf-tennis-scraper"}
 
-        from ...gui.workers.update_worker import UpdateWorker
-        self.update_worker = UpdateWorker(update_cfg_dict)
+        # Download through the main window's worker when it is idle: it checked for this update,
+        # so its HTTP session is already warm
+        parent_worker = getattr(self.parent(), 'update_worker', None)
+        if parent_worker is not None and not parent_worker.isRunning():
+            self.update_worker = parent_worker
+        else:
+            from ...gui.workers.update_worker import UpdateWorker
+            self.update_worker = UpdateWorker(update_cfg_dict)
+            self.update_worker.close_after_run = True  # Only used for this download
+            self.update_worker.setParent(self)  # Kept alive while it runs, even after the dialog lets go of it
 
-        self.update_worker.download_progress.connect(self.progress_bar.setValue)
         self.update_worker.update_downloaded.connect(self._on_download_complete)
         self.update_worker.download_failed.connect(self._on_download_failed)
 
         self.update_worker.trigger_download(self.update_info) # Pass the UpdateInfo OBJECT
+        self.progress_timer.start()
+
+    def _poll_download_progress(self):
+        if self.update_worker:
+            self.progress_bar.setValue(self.update_worker.download_percent)
+
+    def _release_worker(self):
+        """Stops listening to the worker, which may be the main window's and outlive this dialog."""
+        worker, self.update_worker = self.update_worker, None
+        self.progress_timer.stop()
+        if worker is None:
+            return
+        for signal, slot in ((worker.update_downloaded, self._on_download_complete),
+                             (worker.download_failed, self._on_download_failed)):
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):  # Already disconnected
+                pass
 
     def _on_download_complete(self, update_info_obj_with_path: UpdateInfo): # Expect UpdateInfo OBJECT
+        self._release_worker()
         self.progress_bar.setValue(100)
         self.download_btn.setText("Download Complete")
         file_path = update_info_obj_with_path.local_file_path
@@ -167,6 +197,7 @@ class UpdateDialog(QDialog):
         self.accept()
 
     def _on_download_failed(self, error: str):
+        self._release_worker()
         self.progress_bar.setVisible(False)
         self.download_btn.setEnabled(True)
         self.download_btn.setText("Download Update")
@@ -193,4 +224,5 @@ class UpdateDialog(QDialog):
     def closeEvent(self, event):
         if self.update_worker and self.update_worker.isRunning():
             self.logger.debug("UpdateDialog closeEvent while worker might be running.")
+        self._release_worker()
         super().closeEvent(event)
\ No newline at end of file
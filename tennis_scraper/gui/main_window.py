@@ -1,6 +1,6 @@
 import sys
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QMenuBar, QMessageBox,
                                QSplitter, QDockWidget, QTabWidget, QApplication)
@@ -10,6 +10,7 @@ from PySide6.QtCore import Qt, QTimer, Slot, QSettings
 from ..config import Config
 from ..core.engine import TennisScrapingEngine
 from ..core.models import TennisMatch, MatchStatus
+from ..scrapers.base import BaseScraper
 from ..utils.logging import get_logger
 from .. import __version__, get_info
 
@@ -17,14 +18,13 @@ from .components.matches_table import MatchesTable
 from .components.control_panel import ControlPanel
 from .components.log_viewer import LogViewer
 from .components.status_bar import CustomStatusBar
-from .components.settings_panel import SettingsPanel
 
-from .dialogs.about_dialog import AboutDialog
-from .dialogs.export_dialog import ExportDialog
-from .dialogs.update_dialog import UpdateDialog
+# Settings panel and dialogs are imported when first opened, to keep window startup light
 from .workers.scraping_worker import ScrapingWorker
-from .workers.update_worker import UpdateWorker  # Assuming UpdateInfo is correctly handled by UpdateWorker now
-from ..updates.checker import UpdateInfo  # For type hint
+
+if TYPE_CHECKING:  # The update stack is only imported once an update check actually runs
+    from .workers.update_worker import UpdateWorker
+    from ..updates.checker import UpdateInfo
 
 
 class MainWindow(QMainWindow):
@@ -38,7 +38,8 @@ class MainWindow(QMainWindow):
 
         self.engine = TennisScrapingEngine(self.config.to_dict())
         self.scraping_worker: Optional[ScrapingWorker] = None
-        self.update_worker: Optional[UpdateWorker] = None
+        self.update_worker: Optional['UpdateWorker'] = None
+        self._update_worker_config: Optional[Dict[str, Any]] = None
 
         self._current_matches_cache: Dict[str, TennisMatch] = {}  # Cache for individual updates
 
@@ -213,6 +214,7 @@ class MainWindow(QMainWindow):
         self.status_bar.show_progress("Refreshing...", -1)
         self.control_panel.set_scraping_state(True)  # Show as busy
         self._current_matches_cache.clear()
+        BaseScraper.clear_response_cache()  # A manual refresh always fetches fresh data
         # self.matches_table.update_matches([]) # Don't clear table for single refresh, allow append
 
         self.scraping_worker = ScrapingWorker(self.engine, single_run=True)  # Single run
@@ -322,6 +324,7 @@ class MainWindow(QMainWindow):
     def _open_settings(self):
         self.logger.debug("Opening settings dialog.")
         # Pass a copy of the config to avoid direct modification until "Save"
+        from .components.settings_panel import SettingsPanel
         settings_dialog = SettingsPanel(Config.load_from_file(self.config.get_default_config_path()),
                                          self)  # Load fresh for dialog
         if settings_dialog.exec():
@@ -335,19 +338,18 @@ class MainWindow(QMainWindow):
     def _on_settings_changed(self):
         """Apply changes after settings are modified."""
         self.logger.info("Settings changed, updating configuration...")
-        # Re-initialize engine with new config if necessary, or update relevant parts
-        # For simplicity, if scrapers need re-init, stop and restart scraping.
-        was_scraping = self.scraping_worker and self.scraping_worker.isRunning()
+        # The engine only reads the scraping section; leave it alone unless that changed.
+        # It is reconfigured in place, so listeners, filters and scraper sessions are kept.
+        new_config = self.config.to_dict()
+        scraping_changed = new_config['scraping'] != self.engine.scraping_config
+        was_scraping = scraping_changed and self.scraping_worker and self.scraping_worker.isRunning()
         if was_scraping:
             self._stop_scraping()  # Stop current scraping
 
-        self.engine = TennisScrapingEngine(self.config.to_dict())  # Re-init engine
-        # Re-connect engine events because self.engine instance changed
-        self._connect_engine_events_only()  # Reconnect only engine events
+        if scraping_changed:
+            self.engine.reconfigure(new_config)
 
-        # Apply theme immediately if changed
-        current_qapp_style = QApplication.instance().styleSheet()
-        # This is a simple way to re-apply; a more robust way might involve theme manager directly
+        # Apply theme immediately if changed (the theme manager skips the already active theme)
         from .styles.themes import apply_theme
         apply_theme(QApplication.instance(), self.config.ui.theme)
 
@@ -375,11 +377,13 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Export Matches", "No matches to export.")
             return
 
+        from .dialogs.export_dialog import ExportDialog
         export_dialog = ExportDialog(current_matches, self)
         export_dialog.exec()  # Modal execution
 
     @Slot()
     def _show_about_dialog(self):
+        from .dialogs.about_dialog import AboutDialog
         about_dialog = AboutDialog(self)
         about_dialog.exec()
 
@@ -413,20 +417,27 @@ class MainWindow(QMainWindow):
             return
 
         # Ensure config for worker is a dict
-        update_config_dict = self.config.updates.to_dict() if hasattr(self.config.updates, 'to_dict') else vars(
-            self.config.updates)
-
-        self.update_worker = UpdateWorker(update_config_dict)  # Pass config dictionary
-        self.update_worker.update_available.connect(self._on_update_available)
-        self.update_worker.no_update.connect(self._on_no_update_available)
-        self.update_worker.check_failed.connect(self._on_update_check_failed)
+        update_config_dict = self.config.updates.to_dict() if hasattr(self.config.updates, 'to_dict') else dict(vars(
+            self.config.updates))
+
+        # One worker per window, re-run for each check; only rebuilt when the update settings change
+        if self.update_worker is None or self._update_worker_config != update_config_dict:
+            if self.update_worker is not None:
+                self.update_worker.close()
+            from .workers.update_worker import UpdateWorker
+            self.update_worker = UpdateWorker(update_config_dict)  # Pass config dictionary
+            self.update_worker.update_available.connect(self._on_update_available)
+            self.update_worker.no_update.connect(self._on_no_update_available)
+            self.update_worker.check_failed.connect(self._on_update_check_failed)
+            self._update_worker_config = update_config_dict
         self.update_worker.check_for_updates()  # Call method on worker
 
-    @Slot(UpdateInfo)  # Expecting UpdateInfo object
-    def _on_update_available(self, update_info: UpdateInfo):
+    @Slot(object)  # Expecting UpdateInfo object
+    def _on_update_available(self, update_info: 'UpdateInfo'):
         self.logger.info(f"Update available: {update_info.version}")
         self.status_bar.set_status(f"🎉 Update {update_info.version} available!", 0)
 
+        from .dialogs.update_dialog import UpdateDialog
         update_dialog = UpdateDialog(update_info, self)  # Pass UpdateInfo object
         update_dialog.install_requested.connect(self._on_install_update_requested)
         update_dialog.exec()
@@ -478,6 +489,9 @@ class MainWindow(QMainWindow):
         if self.matches_table:
             self.matches_table.save_settings(settings)
 
+        # All keys above go to disk together, in one write
+        settings.sync()
+
         # Save main config file
         self.config.save_to_file()
         self.logger.info("Settings saved.")
@@ -518,6 +532,8 @@ class MainWindow(QMainWindow):
         if self.update_worker and self.update_worker.isRunning():
             self.update_worker.quit()  # Request quit
             # self.update_worker.wait()
+        elif self.update_worker:
+            self.update_worker.close()  # Release its HTTP session
         self.logger.info("All workers signaled to stop.")
 
     def closeEvent(self, event):
@@ -538,11 +554,9 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.logger.error(f"Error during engine cleanup on close: {e}")
 
-        # Ensure log viewer worker is stopped
-        if self.log_viewer and hasattr(self.log_viewer, 'monitor_worker') and self.log_viewer.monitor_worker:
-            if self.log_viewer.monitor_worker.isRunning():
-                self.log_viewer.monitor_worker.stop()
-                self.log_viewer.monitor_worker.wait(1000)
+        # Ensure log viewer stops receiving log records
+        if self.log_viewer:
+            self.log_viewer.stop_monitoring()
 
         self.logger.info("Application shutdown sequence complete.")
         super().closeEvent(event)
\ No newline at end of file
@@ -41,6 +41,7 @@ class ThemeManager:
         self.logger = get_logger(__name__)
         self.themes = {}
         self.current_theme = None
+        self._palettes: Dict[str, QPalette] = {}  # Built once per theme
         self._register_default_themes()
 
     def _register_default_themes(self):
@@ -72,8 +73,16 @@ class ThemeManager:
         try:
             theme = self.get_theme(theme_name)
 
+            # Re-applying the active theme would restyle every widget for nothing
+            if theme is self.current_theme:
+                self.logger.debug(f"Theme already applied: {theme.get_name()}")
+                return
+
             # Apply palette
-            app.setPalette(theme.get_palette())
+            palette = self._palettes.get(theme_name.lower())
+            if palette is None:
+                palette = self._palettes[theme_name.lower()] = theme.get_palette()
+            app.setPalette(palette)
 
             # Apply stylesheet
             stylesheet = theme.get_stylesheet()
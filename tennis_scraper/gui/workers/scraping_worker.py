@@ -26,6 +26,8 @@ class ScrapingWorker(QThread):
         self.single_run = single_run
         self.running = False
         self._loop = None
+        self._stop_event = None  # asyncio.Event in the worker loop, set by stop() to end waits early
+        self._wake_event = None  # asyncio.Event that makes the between-cycle wait re-check stop/interval
 
         # For graceful shutdown
         self._mutex = QMutex()
@@ -35,20 +37,39 @@ class ScrapingWorker(QThread):
         # OPTIMIZED settings for slow computers
         self.refresh_interval = 120  # 2 minutes instead of 10 minutes
         self.min_refresh_interval = 60  # Minimum 1 minute instead of 5 minutes
-        self.last_ui_update = 0  # Throttle UI updates
+        self.last_ui_update = float("-inf")  # Throttle UI updates (monotonic clock)
         self.ui_update_throttle = 10  # Only update UI every 10 seconds max
 
     def set_refresh_interval(self, seconds: int):
         """Set refresh interval with minimum for slow computers."""
         self.refresh_interval = max(self.min_refresh_interval, seconds)
         self.logger.info(f"🐌 Slow computer mode: Refresh interval set to {self.refresh_interval} seconds")
+        # A wait already in progress picks up the new interval; no need to restart the worker
+        self._notify_loop(self._wake_event)
+
+    def _notify_loop(self, event):
+        """Set an asyncio.Event of the worker loop from any thread, without blocking."""
+        loop = self._loop
+        if loop is not None and event is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop closed in the meantime; the worker is already finishing
 
     async def _run_async_tasks(self):
         """Core async logic - OPTIMIZED for slow computers."""
-        if self.single_run:
-            await self._perform_single_scrape_slow()
-        else:
-            await self._perform_gentle_monitoring()
+        try:
+            if self.single_run:
+                await self._perform_single_scrape_slow()
+            else:
+                await self._perform_gentle_monitoring()
+        finally:
+            # Scrapers keep their browser and HTTP session open between cycles; release them
+            # while this worker's event loop is still alive
+            try:
+                await self.engine.cleanup()
+            except Exception as e:
+                self.logger.warning(f"Engine cleanup error: {e}")
 
     async def _perform_single_scrape_slow(self):
         """Single scrape with slow computer optimizations."""
@@ -56,7 +77,7 @@ class ScrapingWorker(QThread):
             self._throttled_status_update("🐌 Starting gentle scrape for slow computer...")
             self.logger.info("ScrapingWorker: Starting SLOW COMPUTER optimized single scrape")
 
-            matches = await self.engine.get_filtered_matches()
+            matches = await self._unless_stopped(self.engine.get_filtered_matches())
 
             if self._stop_requested:
                 self.logger.info("Stop requested during single scrape")
@@ -90,7 +111,7 @@ class ScrapingWorker(QThread):
 
             while self.running and not self._stop_requested:
                 cycle_count += 1
-                scrape_start_time = time.time()
+                scrape_start_time = time.monotonic()
 
                 self.logger.info(f"🔄 Monitoring cycle #{cycle_count} starting...")
 
@@ -98,7 +119,7 @@ class ScrapingWorker(QThread):
                     self._throttled_status_update(f"🐌 Gentle monitoring cycle #{cycle_count}...")
 
                     # Get matches with gentle processing
-                    matches = await self.engine.get_filtered_matches()
+                    matches = await self._unless_stopped(self.engine.get_filtered_matches())
 
                     if self._stop_requested:
                         break
@@ -122,7 +143,7 @@ class ScrapingWorker(QThread):
 
                         self._throttled_status_update(status_msg)
 
-                        scrape_duration = time.time() - scrape_start_time
+                        scrape_duration = time.monotonic() - scrape_start_time
                         self.logger.info(
                             f"Cycle #{cycle_count} completed in {scrape_duration:.1f}s - {total_count} matches")
                     else:
@@ -136,7 +157,7 @@ class ScrapingWorker(QThread):
                 # GENTLE wait with interrupt ability
                 if not self._stop_requested and self.running:
                     self.logger.info(f"💤 Gentle sleep for {self.refresh_interval} seconds...")
-                    await self._gentle_sleep(self.refresh_interval)
+                    await self._gentle_sleep()
 
             self.logger.info(f"Gentle monitoring stopped after {cycle_count} cycles")
 
@@ -144,21 +165,40 @@ class ScrapingWorker(QThread):
             self.logger.error(f"Critical error in gentle monitoring: {e}", exc_info=True)
             self.error_occurred.emit(f"Monitoring system failed: {e}")
 
-    async def _gentle_sleep(self, seconds: int):
-        """Gentle sleep that can be interrupted and doesn't overwhelm slow systems."""
-        # Sleep in 5-second chunks so we can be interrupted
-        chunks = max(1, seconds // 5)
-        chunk_size = seconds / chunks
-
-        for i in range(int(chunks)):
-            if self._stop_requested or not self.running:
-                self.logger.info(f"Sleep interrupted after {i * chunk_size:.1f}s")
-                break
-            await asyncio.sleep(chunk_size)
+    async def _unless_stopped(self, coro):
+        """Run a scrape, cancelling it as soon as stop() is requested (returns None then)."""
+        task = asyncio.ensure_future(coro)
+        stop_wait = asyncio.ensure_future(self._stop_event.wait())
+        await asyncio.wait({task, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+        stop_wait.cancel()
+        if task.done():
+            return task.result()
+
+        self.logger.info("Stop requested - cancelling scrape in progress")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return None
+
+    async def _gentle_sleep(self):
+        """Wait until the next cycle is due, following interval changes and returning at once on stop."""
+        sleep_start = time.monotonic()
+        while not self._stop_requested and self.running:
+            remaining = sleep_start + self.refresh_interval - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wake_event.clear()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+        self.logger.info("Sleep interrupted by stop request")
 
     def _throttled_status_update(self, message: str):
         """Throttled status updates to not overwhelm slow UI."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_ui_update >= 5:  # Max one status update per 5 seconds
             self.status_updated.emit(message)
             self.last_ui_update = current_time
@@ -168,7 +208,7 @@ class ScrapingWorker(QThread):
 
     def _throttled_ui_update(self, matches):
         """Throttled UI updates for slow computers."""
-        current_time = time.time()
+        current_time = time.monotonic()
         # Only update matches UI every 10 seconds max
         if current_time - self.last_ui_update >= self.ui_update_throttle:
             self.matches_updated.emit(matches)
@@ -188,9 +228,8 @@ class ScrapingWorker(QThread):
         try:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
-
-            # Give slow computer a moment to breathe
-            time.sleep(2)
+            self._stop_event = asyncio.Event()
+            self._wake_event = asyncio.Event()
 
             # Run the main async task
             self._loop.run_until_complete(self._run_async_tasks())
@@ -207,9 +246,9 @@ class ScrapingWorker(QThread):
                     for task in pending_tasks:
                         task.cancel()
 
-                    # Give tasks time to cancel
+                    # Wait for the cancellations to finish rather than a fixed second
                     if pending_tasks:
-                        self._loop.run_until_complete(asyncio.sleep(1))
+                        self._loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
 
                     self._loop.run_until_complete(self._loop.shutdown_asyncgens())
                     self._loop.close()
@@ -229,6 +268,7 @@ class ScrapingWorker(QThread):
         self._mutex.unlock()
         self._condition.wakeAll()
 
-        # Give slow computer extra time to process stop request
-        time.sleep(1)
+        # Wake the worker's pending wait from this (GUI) thread without blocking it
+        self._notify_loop(self._stop_event)
+        self._notify_loop(self._wake_event)
         self.logger.debug("Stop request processed for slow computer mode")
\ No newline at end of file
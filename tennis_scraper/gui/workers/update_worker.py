@@ -2,6 +2,7 @@
 Worker threads for GUI operations.
 """
 import asyncio
+import aiohttp
 from PySide6.QtCore import QThread, Signal
 from typing import Optional, Dict, Any
 
@@ -19,7 +20,6 @@ class UpdateWorker(QThread):
     no_update = Signal()
     check_failed = Signal(str)
 
-    download_progress = Signal(int)
     update_downloaded = Signal(UpdateInfo) # Emits UpdateInfo OBJECT with local_file_path
     download_failed = Signal(str)
 
@@ -39,13 +39,55 @@ class UpdateWorker(QThread):
         self.downloader = UpdateDownloader()
         self.action: Optional[str] = None
         self.update_info_to_download: Optional[UpdateInfo] = None
+        # Latest download percentage; the GUI samples it on a timer instead of receiving a signal per step
+        self.download_percent = 0
+        self.close_after_run = False  # Single-use workers release their session when their run ends
+        # One loop and one pooled HTTP session for all of this worker's runs, so a check followed
+        # by a download (or repeated checks) reuse DNS lookups and open connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        return self._loop
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def close(self):
+        """Release the HTTP session and event loop; call when the worker is no longer running."""
+        if not self.isRunning():
+            self._release()
+
+    def _release(self):
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            if self._session and not self._session.closed:
+                self._loop.run_until_complete(self._session.close())
+        except Exception as e:
+            self.logger.debug(f"UpdateWorker: Error closing HTTP session: {e}")
+        finally:
+            self._session = None
+            self._loop.close()
+
+    async def _check_with_session(self) -> Optional[UpdateInfo]:
+        return await self.update_checker.check_for_updates(session=await self._get_session())
+
+    async def _download_with_session(self, progress_cb) -> Optional[str]:
+        return await self.downloader.download(self.update_info_to_download, progress_cb,
+                                              session=await self._get_session())
 
     def _check_async(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        loop = self._get_loop()
         try:
             self.logger.info("UpdateWorker: Checking for updates...")
-            update_info_obj: Optional[UpdateInfo] = loop.run_until_complete(self.update_checker.check_for_updates())
+            update_info_obj: Optional[UpdateInfo] = loop.run_until_complete(self._check_with_session())
             if update_info_obj:
                 self.logger.info(f"UpdateWorker: Update found - {update_info_obj.version}")
                 self.update_available.emit(update_info_obj) # EMIT THE OBJECT
@@ -55,8 +97,6 @@ class UpdateWorker(QThread):
         except Exception as e:
             self.logger.error(f"UpdateWorker: Update check failed: {e}", exc_info=True)
             self.check_failed.emit(str(e))
-        finally:
-            loop.close()
 
     def _download_async(self):
         if not self.update_info_to_download:
@@ -64,16 +104,13 @@ class UpdateWorker(QThread):
             self.download_failed.emit("Internal error: Update information missing.")
             return
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        loop = self._get_loop()
         try:
             self.logger.info(f"UpdateWorker: Downloading update {self.update_info_to_download.version}...")
             def progress_cb(progress_val):
-                self.download_progress.emit(progress_val)
+                self.download_percent = progress_val
 
-            file_path: Optional[str] = loop.run_until_complete(
-                self.downloader.download(self.update_info_to_download, progress_cb)
-            )
+            file_path: Optional[str] = loop.run_until_complete(self._download_with_session(progress_cb))
 
             if file_path:
                 self.logger.info(f"UpdateWorker: Download complete - {file_path}")
@@ -85,8 +122,6 @@ class UpdateWorker(QThread):
         except Exception as e:
             self.logger.error(f"UpdateWorker: Update download failed: {e}", exc_info=True)
             self.download_failed.emit(str(e))
-        finally:
-            loop.close()
 
     def run(self):
         if not self.action:
@@ -104,6 +139,8 @@ class UpdateWorker(QThread):
                 self.download_failed.emit("Cannot download: Update details not provided.")
         else:
             self.logger.warning(f"UpdateWorker: Unknown action '{self.action}'")
+        if self.close_after_run:
+            self._release()
         self.logger.info(f"UpdateWorker thread for action '{self.action}' finished.")
 
     def check_for_updates(self):
@@ -113,4 +150,5 @@ class UpdateWorker(QThread):
     def trigger_download(self, update_info: UpdateInfo):
         self.action = "download"
         self.update_info_to_download = update_info
+        self.download_percent = 0
         self.start()
\ No newline at end of file
@@ -1,5 +1,8 @@
 import asyncio
+import re
+import time
 import aiohttp
+from urllib.parse import urlparse
 from abc import abstractmethod
 from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
 from datetime import datetime
@@ -9,6 +12,29 @@ from ..core.models import TennisMatch, Player, Score, MatchStatus, ScrapingResul
 from ..utils.logging import get_logger
 
 
+def _keywords_re(*keywords: str) -> re.Pattern:
+    """One compiled scan equivalent to any(kw in text for kw in keywords)."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Status keyword groups for _parse_match_status, compiled once instead of scanned keyword by keyword per match
+_FINISHED_RE = _keywords_re("fin.", "finished", "completed", "ended", "full time", "ft",
+                            "final", "result", "won", "lost", "victory", "defeat")
+_LIVE_RE = _keywords_re("live", "playing", "in progress", "ongoing", "current",
+                        "1st set", "2nd set", "3rd set", "4th set", "5th set",
+                        "break", "serving", "match point", "set point", "game point",
+                        "deuce", "advantage", "ad", "break point")
+_TIME_RE = re.compile(r'\d{1,2}:\d{2}|\d{1,2}h\d{2}|\d{1,2}\.\d{2}')
+_POSTPONED_RE = _keywords_re("postp.", "postponed", "delayed")
+_CANCELLED_RE = _keywords_re("canc.", "cancelled", "canceled")
+_WALKOVER_RE = _keywords_re("walkover", "w.o.", "w/o", "wo")
+_RETIRED_RE = _keywords_re("retired", "ret.", "retirement")
+_INTERRUPTED_RE = _keywords_re("interrupted", "susp.", "suspended", "rain", "weather")
+_AWARDED_RE = _keywords_re("awarded", "def.", "default")
+_SCHEDULED_RE = _keywords_re("sched.", "scheduled", "not started", "upcoming", "soon",
+                             "today", "tomorrow", "vs", "v", "-", "tbd", "tba")
+
+
 class BaseScraper(MatchScraper):
     """
     Base class for specific website scrapers.
@@ -16,22 +42,84 @@ class BaseScraper(MatchScraper):
     and basic data parsing helpers.
     """
 
+    # Site availability rarely changes between scrape cycles, so probes are cached per URL
+    # (shared by all instances, including one recreated after its source is re-enabled).
+    AVAILABILITY_TTL = 300
+    UNAVAILABILITY_TTL = 30  # Retry an unreachable site sooner
+    _availability_cache: Dict[str, Tuple[bool, float]] = {}
+
+    # Short-lived GET response bodies per URL: (expires_at, body). Cleared by a manual refresh.
+    _response_cache: Dict[str, Tuple[float, str]] = {}
+
     def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
         self._session: Optional[aiohttp.ClientSession] = None
+        self._next_request_at: Dict[str, float] = {}  # host -> earliest monotonic time for its next paced request
+        super().__init__(config)
+
+    def reconfigure(self, config: Dict[str, Any]):
+        """Apply new settings; the open HTTP session is kept."""
+        super().reconfigure(config)
         self.request_timeout = config.get('request_timeout', 10)
         self.max_retries = config.get('max_retries', 3)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp ClientSession."""
         if self._session is None or self._session.closed:
+            # Kept for the whole worker run, so repeat cycles reuse warm keep-alive connections
+            connector = aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=120)
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 headers={'User-Agent': self.config.get('user_agent', 'Mozilla/5.0')}
             )
         return self._session
 
+    async def _wait_for_host_slot(self, url: str):
+        """Spaces request starts to one host delay_between_requests apart, even when issued concurrently."""
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        start_at = max(now, self._next_request_at.get(host, 0.0))
+        self._next_request_at[host] = start_at + self.delay_between_requests  # Reserved before awaiting
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    async def _fetch_text(self, url: str, ttl: float = 0, headers: Optional[Dict[str, str]] = None,
+                          paced: bool = False) -> str:
+        """GET a URL's body, reusing a response fetched less than ttl seconds ago.
+        Paced requests respect the per-host spacing of _wait_for_host_slot."""
+        cached = self._response_cache.get(url)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        if paced:
+            await self._wait_for_host_slot(url)
+        session = await self._get_session()
+        async with session.get(url, headers=headers, timeout=self.request_timeout) as response:
+            response.raise_for_status()  # Will raise an error for 4xx/5xx responses
+            body = await response.text()
+        if ttl > 0:
+            BaseScraper._response_cache[url] = (time.monotonic() + ttl, body)
+        return body
+
+    @classmethod
+    def clear_response_cache(cls):
+        """Forget cached responses so the next scrape fetches fresh data."""
+        BaseScraper._response_cache.clear()
+
     async def _check_site_availability(self, url: str, timeout: int = 5) -> bool:
-        """Check if the base site URL is reachable."""
+        """Check if the base site URL is reachable, reusing a recent result."""
+        cached = self._availability_cache.get(url)
+        if cached is not None:
+            available, checked_at = cached
+            ttl = self.AVAILABILITY_TTL if available else self.UNAVAILABILITY_TTL
+            if time.monotonic() - checked_at < ttl:
+                return available
+
+        available = await self._probe_site(url, timeout)
+        BaseScraper._availability_cache[url] = (available, time.monotonic())
+        return available
+
+    async def _probe_site(self, url: str, timeout: int) -> bool:
+        """Issue a HEAD request to see if the site responds."""
         try:
             session = await self._get_session()
             async with session.head(url, timeout=timeout, allow_redirects=True) as response:
@@ -78,50 +166,27 @@ class BaseScraper(MatchScraper):
         s_lower = status_str.lower().strip()
         s_lower = s_lower.replace("'", "").replace('"', '')
 
-        finished_keywords = [
-            "fin.", "finished", "completed", "ended", "full time", "ft",
-            "final", "result", "won", "lost", "victory", "defeat"
-        ]
-        if any(kw in s_lower for kw in finished_keywords):
+        if _FINISHED_RE.search(s_lower):
             return MatchStatus.FINISHED
-
-        live_keywords = [
-            "live", "playing", "in progress", "ongoing", "current",
-            "1st set", "2nd set", "3rd set", "4th set", "5th set",
-            "break", "serving", "match point", "set point", "game point",
-            "deuce", "advantage", "ad", "break point"
-        ]
-        if any(kw in s_lower for kw in live_keywords):
+        if _LIVE_RE.search(s_lower):
             return MatchStatus.LIVE
+        if _TIME_RE.search(s_lower):
+            return MatchStatus.SCHEDULED
 
-        time_patterns = [
-            r'\d{1,2}:\d{2}',
-            r'\d{1,2}h\d{2}',
-            r'\d{1,2}\.\d{2}',
-        ]
-        import re
-        for pattern in time_patterns:
-            if re.search(pattern, s_lower):
-                return MatchStatus.SCHEDULED
-
-        if any(kw in s_lower for kw in ["postp.", "postponed", "delayed"]):
+        if _POSTPONED_RE.search(s_lower):
             return MatchStatus.POSTPONED
-        if any(kw in s_lower for kw in ["canc.", "cancelled", "canceled"]):
+        if _CANCELLED_RE.search(s_lower):
             return MatchStatus.CANCELLED
-        if any(kw in s_lower for kw in ["walkover", "w.o.", "w/o", "wo"]):
+        if _WALKOVER_RE.search(s_lower):
             return MatchStatus.WALKOVER
-        if any(kw in s_lower for kw in ["retired", "ret.", "retirement"]):
+        if _RETIRED_RE.search(s_lower):
             return MatchStatus.RETIRED
-        if any(kw in s_lower for kw in ["interrupted", "susp.", "suspended", "rain", "weather"]):
+        if _INTERRUPTED_RE.search(s_lower):
             return MatchStatus.INTERRUPTED
-        if any(kw in s_lower for kw in ["awarded", "def.", "default"]):
+        if _AWARDED_RE.search(s_lower):
             return MatchStatus.AWARDED
 
-        scheduled_keywords = [
-            "sched.", "scheduled", "not started", "upcoming", "soon",
-            "today", "tomorrow", "vs", "v", "-", "tbd", "tba"
-        ]
-        if any(kw in s_lower for kw in scheduled_keywords):
+        if _SCHEDULED_RE.search(s_lower):
             return MatchStatus.SCHEDULED
 
         if len(s_lower) <= 2 or s_lower in ["-", "vs", "v", ""]:
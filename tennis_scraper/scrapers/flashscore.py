@@ -1,5 +1,8 @@
 import asyncio
 import re
+import aiohttp
+import tempfile
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable, Awaitable
 from datetime import datetime, timezone
 
@@ -8,21 +11,30 @@ from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError,
     Page,
     BrowserContext,
-    Browser,
-    ElementHandle,
-    Route,
-    JSHandle  # Import JSHandle for type hinting if needed
+    Route
 )
 
 from .base import BaseScraper
 from ..core.models import TennisMatch, Player, Score, MatchStatus, ScrapingResult, TournamentLevel, Surface
 
+_TIE_BREAK_SCORE_RE = re.compile(r'\[(\d+)-(\d+)\]')
+
+
+MATCH_ROW_SELECTOR = "div.event__match, a.eventRowLink"
+
 
 class FlashscoreLiveTabClicker:
     def __init__(self, page: Page, logger):
         self.page = page
         self.logger = logger
 
+    async def _wait_for_match_rows(self, timeout_ms: int = 15000):
+        """Wait until match rows are rendered instead of sleeping a fixed time."""
+        try:
+            await self.page.wait_for_selector(MATCH_ROW_SELECTOR, state="attached", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            self.logger.warning(f"No match rows appeared within {timeout_ms / 1000:.0f}s of clicking LIVE tab.")
+
     async def click_live_tab(self) -> bool:
         strategies = [
             self._strategy_simple_text,
@@ -35,7 +47,7 @@ class FlashscoreLiveTabClicker:
                 success = await strategy()
                 if success:
                     self.logger.info(f"✅ LIVE tab clicked successfully using strategy {i}")
-                    await self.page.wait_for_timeout(5000)
+                    await self._wait_for_match_rows()
                     return True
             except Exception as e:
                 self.logger.debug(f"Strategy {i} failed: {e}")
@@ -124,16 +136,136 @@ class FlashscoreScraper(BaseScraper):
     MAX_HEADERS_TO_CHECK = 200
     SIMPLIFIED_TIE_BREAK_CHECK = True
 
+    # Internal data feed behind the tennis page: "¬~"-separated records of "¬"-separated "key÷value" fields
+    FEED_URL = "https://local-global.flashscore.ninja/2/x/feed/f_2_0_3_en_1"
+    FEED_SIGN = "SW9D1eZo"  # x-fsign header the tennis page sends; kept here only, never in the user's config
+    FEED_LIVE_STATUS = "2"
+    FEED_BOOKMAKER_KEY = "OD"  # Live-odds field: comma-separated ids of the bookmakers offering the event
+    FEED_SET_KEYS = (("BA", "BB"), ("BC", "BD"), ("BE", "BF"), ("BG", "BH"), ("BI", "BJ"))
+    FEED_CACHE_TTL = 20  # Live scores; short enough that a cycle never shows stale games
+    _feed_disabled = False  # Set for the rest of the session once the feed rejects us or changes format
+
+    # Collects every league header with its match rows in the page, so the whole LIVE tab
+    # comes back in a single round trip. Args: [max headers, bookmaker id].
+    EXTRACT_LIVE_MATCHES_JS = """([maxHeaders, bookmakerId]) => {
+        const HEADER = 'div.wcl-header_uBhYi.wclLeagueHeader';
+        const MATCH_ROW = 'a.eventRowLink, div.event__match, div.event__match--scheduled, '
+                        + 'div.event__match--live, div.event__match--static';
+        const text = (root, sel) => {
+            const node = root && root.querySelector(sel);
+            const value = node && node.textContent;
+            return value && value.trim() ? value.trim() : '';
+        };
+        return Array.from(document.querySelectorAll(HEADER)).slice(0, maxHeaders).map(header => {
+            const titleBox = header.querySelector('div.event__titleBox');
+            const name = [text(titleBox, 'span.wcl-overline_rOFfd'), text(titleBox, 'a.wcl-link_bLtj3')]
+                .filter(Boolean).join(': ');
+            const matches = [];
+            for (let el = header.nextElementSibling; el && !el.matches(HEADER); el = el.nextElementSibling) {
+                if (!el.matches(MATCH_ROW)) continue;
+                const html = el.innerHTML;
+                const scoreWithState = el.querySelector('.event__score[data-state]');
+                matches.push({
+                    home: text(el, '.event__participant--home'),
+                    away: text(el, '.event__participant--away'),
+                    homeScore: text(el, '.event__score--home'),
+                    awayScore: text(el, '.event__score--away'),
+                    state: scoreWithState ? scoreWithState.getAttribute('data-state') : '',
+                    stage: text(el, '.event__stage--block') || text(el, '.event__stage'),
+                    bookmakerIds: Array.from(el.querySelectorAll("div.liveBetWrapper, [class*='liveBetWrapper']"))
+                        .map(w => w.getAttribute('data-bookmaker-id')),
+                    htmlHasBookmaker: html.includes(bookmakerId) || html.includes('549')
+                        || html.toLowerCase().includes('bet365'),
+                    describedBy: el.getAttribute('aria-describedby'),
+                    id: el.getAttribute('id')
+                });
+            }
+            return {name, matches};
+        });
+    }"""
+
+    # One browser shared by every instance (the engine is rebuilt on settings changes) and kept
+    # between scrape cycles. Playwright objects belong to the event loop that created them.
+    BROWSER_PROFILE_DIR = Path(tempfile.gettempdir()) / "itf_tennis_scraper_profile"
+    _playwright = None
+    _context: Optional[BrowserContext] = None
+    _context_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Request blocking of the shared context, read by its route on every request so settings changes apply
+    _block_types: List[str] = []
+    _block_names: List[str] = []
+
     async def get_source_name(self) -> str:
         return "flashscore"
 
     async def is_available(self) -> bool:
         return await self._check_site_availability(self.FLASHCORE_BASE_URL, timeout=self.request_timeout)
 
-    async def _route_handler(self, route: Route, block_types: List[str], block_names: List[str]):
+    async def _get_browser_context(self, headless: bool, user_agent: str,
+                                   block_types: List[str], block_names: List[str]) -> BrowserContext:
+        """Return the shared browser context, launching it on first use in this event loop."""
+        cls = FlashscoreScraper
+        cls._block_types, cls._block_names = list(block_types), list(block_names)
+        loop = asyncio.get_running_loop()
+        if cls._context is not None and cls._context_loop is loop:
+            return cls._context
+
+        if cls._context_loop is not None:
+            await self._close_stale_browser()
+
+        self.logger.info("🚀 Starting Playwright...")
+        cls._playwright = await async_playwright().start()
+        browser_args = ['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu',
+                        '--disable-features=VizDisplayCompositor']
+        # A persistent profile keeps Flashscore's scripts and the cookie consent between runs
+        cls._context = await cls._playwright.chromium.launch_persistent_context(
+            str(self.BROWSER_PROFILE_DIR), headless=headless, args=browser_args,
+            user_agent=user_agent, viewport={'width': 1366, 'height': 768},
+            java_script_enabled=True, ignore_https_errors=True
+        )
+        await cls._context.route("**/*", cls._route_handler)
+        cls._context_loop = loop
+        return cls._context
+
+    async def _close_stale_browser(self):
+        """Close a browser left behind by another worker's event loop before this loop launches its own."""
+        cls = FlashscoreScraper
+        old_loop, context, playwright = cls._context_loop, cls._context, cls._playwright
+        if old_loop.is_running():
+            # Both would use the same profile directory; the other worker closes its own browser when it ends
+            raise RuntimeError("Flashscore browser is still in use by another worker")
+
+        cls._context = cls._playwright = cls._context_loop = None
+        if old_loop.is_closed():
+            self.logger.warning("⚠️ Previous Flashscore browser could not be closed: its event loop is gone")
+            return
+        try:
+            # Playwright objects only work on their own loop; it is idle, so drive it from a helper thread
+            await asyncio.to_thread(old_loop.run_until_complete, cls._close_browser(context, playwright))
+            self.logger.info("Closed Flashscore browser left by a previous worker")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not close previous Flashscore browser: {e}")
+
+    @staticmethod
+    async def _close_browser(context: Optional[BrowserContext], playwright):
+        if context:
+            await context.close()
+        if playwright:
+            await playwright.stop()
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared browser; call from the event loop that scraped before it closes."""
+        if cls._context_loop is not None and cls._context_loop is not asyncio.get_running_loop():
+            return  # Owned by a worker loop that is still running; it closes its own browser
+        context, playwright = cls._context, cls._playwright
+        cls._context = cls._playwright = cls._context_loop = None
+        await cls._close_browser(context, playwright)
+
+    @classmethod
+    async def _route_handler(cls, route: Route):
         resource_type = route.request.resource_type.lower()
         request_url_lower = route.request.url.lower()
-        if resource_type in block_types:
+        if resource_type in cls._block_types:
             try:
                 await route.abort(); return
             except Exception:
@@ -146,7 +278,7 @@ class FlashscoreScraper(BaseScraper):
                     await route.abort(); return
                 except Exception:
                     return
-        for name_fragment in block_names:
+        for name_fragment in cls._block_names:
             if name_fragment.lower() in request_url_lower:
                 try:
                     await route.abort(); return
@@ -160,56 +292,47 @@ class FlashscoreScraper(BaseScraper):
     async def _simplified_tie_break_detection(self, status_text: str, score_str: str,
                                               home_player_name: str, away_player_name: str) -> tuple[bool, str]:
         simple_keywords = ["match tie break", "match tie-break", "super tiebreak", "first to 10", "tie break"]
+        status_lower = status_text.lower()
         if status_text:
-            status_lower = status_text.lower()
             for keyword in simple_keywords:
                 if keyword in status_lower:
                     self.logger.critical(
                         f"🚨 TIE BREAK (status): {home_player_name} vs {away_player_name} by status: '{keyword}'")
                     return True, f"status_{keyword.replace(' ', '_')}"
         if score_str and '[' in score_str and ']' in score_str:
-            bracket_match = re.search(r'\[(\d+)-(\d+)\]', score_str)
+            bracket_match = _TIE_BREAK_SCORE_RE.search(score_str)
             if bracket_match:
                 home_tb, away_tb = int(bracket_match.group(1)), int(bracket_match.group(2))
                 if (home_tb >= 7 or away_tb >= 7) and abs(home_tb - away_tb) >= 0:
                     self.logger.critical(
                         f"🚨 TIE BREAK (score): {home_player_name} vs {away_player_name} by score: [{home_tb}-{away_tb}]")
                     return True, f"score_bracket_{home_tb}_{away_tb}"
-        if "tie" in status_text.lower() and "break" in status_text.lower():
+        if "tie" in status_lower and "break" in status_lower:
             self.logger.critical(
                 f"🚨 TIE BREAK (generic status): {home_player_name} vs {away_player_name} by status: '{status_text}'")
             return True, "status_generic_tie_break"
         return False, "none"
 
-    async def _process_match_from_live_tab(self, match_element: ElementHandle, current_tournament_name: str,
-                                           element_index: int, bookmaker_id_to_check: str, page_url: str) -> Optional[
-        TennisMatch]:
+    async def _process_match_from_live_tab(self, match_data: Dict[str, Any], current_tournament_name: str,
+                                           element_index: int, bookmaker_id_to_check: str, page_url: str,
+                                           source_name: str, scraped_at: datetime) -> Optional[TennisMatch]:
         home_player_name = "N/A"
         away_player_name = "N/A"
         try:
-            home_player_name = await self._get_text_from_element(match_element, ".event__participant--home")
-            away_player_name = await self._get_text_from_element(match_element, ".event__participant--away")
+            home_player_name = match_data['home']
+            away_player_name = match_data['away']
 
             if not home_player_name or not away_player_name:
                 self.logger.info(
                     f"Live Idx {element_index}: Skipping match in '{current_tournament_name}' (Players: {home_player_name}/{away_player_name}) due to missing player names.")
                 return None
 
-            home_score = await self._get_text_from_element(match_element, ".event__score--home")
-            away_score = await self._get_text_from_element(match_element, ".event__score--away")
+            home_score = match_data['homeScore']
+            away_score = match_data['awayScore']
             score_str = f"{home_score}-{away_score}" if home_score is not None and away_score is not None else ""
 
-            status_text_from_attr = ""
-            status_element_on_score = await match_element.query_selector(".event__score[data-state]")
-            if status_element_on_score:
-                status_text_from_attr = (
-                            await status_element_on_score.get_attribute("data-state") or "").strip().lower()
-
-            status_text_from_stage_block = await self._get_text_from_element(match_element, ".event__stage--block",
-                                                                             default="")
-            if not status_text_from_stage_block:
-                status_text_from_stage_block = await self._get_text_from_element(match_element, ".event__stage",
-                                                                                 default="")
+            status_text_from_attr = (match_data['state'] or "").strip().lower()
+            status_text_from_stage_block = match_data['stage']
             final_status_text = status_text_from_attr if status_text_from_attr else status_text_from_stage_block
 
             is_match_tie_break, detection_method = await self._simplified_tie_break_detection(
@@ -220,14 +343,13 @@ class FlashscoreScraper(BaseScraper):
             self.logger.info(
                 f"Live Idx {element_index} ({home_player_name} vs {away_player_name}) in '{current_tournament_name}': Checking for Bet365 ID '{bookmaker_id_to_check}'...")
             try:
-                bet_wrappers = await match_element.query_selector_all("div.liveBetWrapper, [class*='liveBetWrapper']")
+                bet_wrappers = match_data['bookmakerIds']
                 if not bet_wrappers:
                     self.logger.info(f"Live Idx {element_index}: No .liveBetWrapper elements found.")
                 else:
                     self.logger.info(
                         f"Live Idx {element_index}: Found {len(bet_wrappers)} liveBetWrapper-like elements.")
-                    for i, wrapper in enumerate(bet_wrappers):
-                        bookmaker_id_attr = await wrapper.get_attribute("data-bookmaker-id")
+                    for i, bookmaker_id_attr in enumerate(bet_wrappers):
                         self.logger.info(
                             f"Live Idx {element_index}: Wrapper {i} data-bookmaker-id: '{bookmaker_id_attr}'")
                         if bookmaker_id_attr == bookmaker_id_to_check:
@@ -242,8 +364,7 @@ class FlashscoreScraper(BaseScraper):
                 if not has_bet365_indicator:
                     self.logger.info(
                         f"Live Idx {element_index}: Bet365 ID not in wrappers. Falling back to inner HTML check for '{bookmaker_id_to_check}' or 'bet365'.")
-                    element_html = await match_element.inner_html()
-                    if bookmaker_id_to_check in element_html or '549' in element_html or 'bet365' in element_html.lower():
+                    if match_data['htmlHasBookmaker']:
                         has_bet365_indicator = True
                         self.logger.info(f"Live Idx {element_index}: Bet365 indicator FOUND in inner HTML.")
                     else:
@@ -259,8 +380,8 @@ class FlashscoreScraper(BaseScraper):
                 self.logger.info(
                     f"Live Idx {element_index} ({home_player_name} vs {away_player_name}) in '{current_tournament_name}' HAS Bet365 indicator. Proceeding.")
 
-            match_id_from_link = await match_element.get_attribute("aria-describedby")
-            match_id_from_id_attr = await match_element.get_attribute("id")
+            match_id_from_link = match_data['describedBy']
+            match_id_from_id_attr = match_data['id']
             match_id = match_id_from_link or match_id_from_id_attr or f"flashscore_itf_{element_index}_{hash(home_player_name + away_player_name) % 10000}"
             if match_id.startswith("g_2_"):
                 match_id = match_id[4:]
@@ -274,7 +395,6 @@ class FlashscoreScraper(BaseScraper):
                 'is_itf_match': True
             }
 
-            source_name = await self.get_source_name()
             parsed_status = self._parse_match_status(final_status_text, score_str)
 
             match_obj = TennisMatch(
@@ -289,7 +409,7 @@ class FlashscoreScraper(BaseScraper):
                 source_url=page_url,
                 match_id=match_id,
                 scheduled_time=None,
-                last_updated=datetime.now(timezone.utc),
+                last_updated=scraped_at,
                 metadata=metadata_dict
             )
             return match_obj
@@ -299,6 +419,114 @@ class FlashscoreScraper(BaseScraper):
                 exc_info=True)
             return None
 
+    async def _scrape_from_feed(self, bookmaker_id_to_check: str) -> Optional[List[TennisMatch]]:
+        """Read live ITF Men-Singles Bet365 matches straight from the feed; None means use the browser."""
+        if FlashscoreScraper._feed_disabled:
+            return None
+        headers = {
+            'x-fsign': self.FEED_SIGN,
+            'Referer': f"{self.FLASHCORE_BASE_URL}/",
+        }
+        try:
+            body = await self._fetch_text(self.FEED_URL, ttl=self.FEED_CACHE_TTL, headers=headers)
+        except aiohttp.ClientResponseError as e_http:
+            if e_http.status in (401, 403):
+                # The sign token has been rotated; every further request would be rejected too
+                self._disable_feed(f"HTTP {e_http.status}, FEED_SIGN is probably stale")
+            else:
+                self.logger.warning(f"Flashscore feed returned HTTP {e_http.status}")
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not fetch Flashscore feed: {e}")
+            return None
+
+        return await self._parse_feed(body, bookmaker_id_to_check)
+
+    def _disable_feed(self, reason: str):
+        """Stop using the feed until the app restarts; the browser scrape takes over."""
+        FlashscoreScraper._feed_disabled = True
+        self.logger.warning(f"⚠️ Flashscore feed disabled for this session ({reason}); using the browser")
+
+    async def _parse_feed(self, body: str, bookmaker_id_to_check: str) -> Optional[List[TennisMatch]]:
+        """Parse feed records into live ITF Men-Singles Bet365 matches; None if the feed can't tell."""
+        if "AA÷" not in body:
+            self._disable_feed("format not recognised")
+            return None
+
+        source_name = await self.get_source_name()
+        page_url = f"{self.FLASHCORE_BASE_URL}{self.TENNIS_URL_PATH}"
+        scraped_at = datetime.now(timezone.utc)  # Every record comes from the same response
+        matches: List[TennisMatch] = []
+        current_tournament_name = ""
+        itf_live_records = 0
+        records_with_odds = 0
+
+        for record in body.split("¬~"):
+            fields = dict(field.split("÷", 1) for field in record.split("¬") if "÷" in field)
+            if "ZA" in fields:
+                current_tournament_name = fields["ZA"].strip()
+                continue
+            if "AA" not in fields or fields.get("AB") != self.FEED_LIVE_STATUS:
+                continue
+
+            name_lower = current_tournament_name.lower()
+            if not ("itf" in name_lower and "men" in name_lower and "singles" in name_lower):
+                continue
+            itf_live_records += 1
+
+            if self.FEED_BOOKMAKER_KEY not in fields:
+                continue
+            records_with_odds += 1
+            if bookmaker_id_to_check not in fields[self.FEED_BOOKMAKER_KEY].split(","):
+                continue
+
+            home_player_name = fields.get("AE", "").strip()
+            away_player_name = fields.get("AF", "").strip()
+            if not home_player_name or not away_player_name:
+                continue
+
+            score_str = " ".join(
+                f"{fields[home_key]}-{fields[away_key]}"
+                for home_key, away_key in self.FEED_SET_KEYS
+                if home_key in fields and away_key in fields
+            )
+            is_match_tie_break, detection_method = await self._simplified_tie_break_detection(
+                "", score_str, home_player_name, away_player_name
+            )
+
+            matches.append(TennisMatch(
+                home_player=Player(name=self._parse_player_name(home_player_name)),
+                away_player=Player(name=self._parse_player_name(away_player_name)),
+                score=Score.from_string(score_str),
+                status=MatchStatus.LIVE,
+                tournament=current_tournament_name,
+                tournament_level=self._determine_tournament_level_flashscore(current_tournament_name),
+                surface=self._determine_surface_from_name(current_tournament_name),
+                source=source_name,
+                source_url=page_url,
+                match_id=fields["AA"],
+                scheduled_time=None,
+                last_updated=scraped_at,
+                metadata={
+                    'has_bet365_indicator': True,
+                    'is_match_tie_break': is_match_tie_break,
+                    'tie_break_detection_method': detection_method,
+                    'tournament_name_header': current_tournament_name,
+                    'is_itf_match': True,
+                    'from_feed': True
+                }
+            ))
+            if len(matches) >= self.MAX_MATCHES_TO_PROCESS:
+                break
+
+        # Live ITF matches without any odds field: the feed can't answer the Bet365 question
+        if itf_live_records and not records_with_odds:
+            self.logger.warning("Flashscore feed carries no bookmaker data for live ITF matches")
+            return None
+
+        self.logger.info(f"📡 Feed: {len(matches)} of {itf_live_records} live ITF Men-Singles matches have Bet365")
+        return matches
+
     def _determine_tournament_level_flashscore(self, tournament_name: str) -> TournamentLevel:
         if not tournament_name: return TournamentLevel.UNKNOWN
         name_lower = tournament_name.lower()
@@ -324,17 +552,6 @@ class FlashscoreScraper(BaseScraper):
         if "carpet" in name_lower: return Surface.CARPET
         return Surface.UNKNOWN
 
-    async def _get_text_from_element(self, parent_element: ElementHandle, selector: str, default: str = "") -> str:
-        try:
-            element = await parent_element.query_selector(selector)
-            if element:
-                text = await element.text_content()
-                if text is not None and text.strip():
-                    return text.strip()
-        except Exception as e:
-            self.logger.debug(f"Could not get text for selector '{selector}' within parent: {e}")
-        return default
-
     async def scrape_matches(self, progress_callback: Optional[
         Callable[[TennisMatch], Awaitable[None]]] = None) -> ScrapingResult:
         start_time_dt = datetime.now(timezone.utc)
@@ -349,6 +566,28 @@ class FlashscoreScraper(BaseScraper):
         bookmaker_id_to_check = "".join(filter(str.isdigit, bet365_indicator_fragment))
         if not bookmaker_id_to_check: bookmaker_id_to_check = "549"
 
+        # The feed answers in well under a second; the rendered page takes tens of seconds
+        if self.config.get('flashscore_use_feed', True):
+            feed_matches = await self._scrape_from_feed(bookmaker_id_to_check)
+            if feed_matches is not None:
+                for match_obj in feed_matches:
+                    if progress_callback:
+                        await progress_callback(match_obj)
+                return ScrapingResult(
+                    source=source_name,
+                    matches=feed_matches,
+                    success=True,
+                    duration_seconds=(datetime.now(timezone.utc) - start_time_dt).total_seconds(),
+                    timestamp=datetime.now(timezone.utc),
+                    metadata={
+                        'from_feed': True,
+                        'itf_men_singles_bet365_matches_found': len(feed_matches),
+                        'tie_break_matches': len([m for m in feed_matches if m.metadata.get('is_match_tie_break')]),
+                        'match_limit_applied': self.MAX_MATCHES_TO_PROCESS
+                    }
+                )
+            self.logger.warning("⚠️ Flashscore feed unusable - falling back to browser scraping.")
+
         self.logger.info(
             f"🎯 ITF MEN-SINGLES SCRAPING (LIVE TAB STRATEGY) - Max {self.MAX_MATCHES_TO_PROCESS} matches. Bet365 ID: {bookmaker_id_to_check}")
 
@@ -359,26 +598,14 @@ class FlashscoreScraper(BaseScraper):
                                 "doubleclick", "adsystem"]
         element_timeout_ms = 45000
 
-        playwright = None
-        browser: Optional[Browser] = None
-        context: Optional[BrowserContext] = None
         page: Optional[Page] = None
 
         processed_headers_count = 0
         processed_match_elements_total = 0
 
         try:
-            self.logger.info("🚀 Starting Playwright...")
-            playwright = await async_playwright().start()
-            browser_args = ['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu',
-                            '--disable-features=VizDisplayCompositor']
-            browser = await playwright.chromium.launch(headless=headless_mode, args=browser_args)
-            context = await browser.new_context(
-                user_agent=user_agent_new, viewport={'width': 1366, 'height': 768},
-                java_script_enabled=True, ignore_https_errors=True
-            )
-            await context.route("**/*",
-                                lambda route: self._route_handler(route, block_resource_types, block_resource_names))
+            context = await self._get_browser_context(headless_mode, user_agent_new,
+                                                      block_resource_types, block_resource_names)
             page = await context.new_page()
             current_page_url = f"{self.FLASHCORE_BASE_URL}{self.TENNIS_URL_PATH}"
             self.logger.info(f"📍 Navigating to: {current_page_url}")
@@ -390,7 +617,7 @@ class FlashscoreScraper(BaseScraper):
                     cookie_btn = page.locator(sel).first
                     if await cookie_btn.is_visible(timeout=8000):
                         await cookie_btn.click(timeout=5000)
-                        await page.wait_for_timeout(2000)
+                        await cookie_btn.wait_for(state="hidden", timeout=5000)
                         self.logger.info("Cookie banner accepted.")
                         break
             except Exception:
@@ -403,46 +630,43 @@ class FlashscoreScraper(BaseScraper):
                 self.logger.warning(
                     "⚠️ Failed to click LIVE tab. Scraping current page. Results might be limited or incorrect.")
             else:
-                self.logger.info("✅ Successfully clicked LIVE tab. Waiting for content to fully load...")
-                await page.wait_for_timeout(8000)
+                self.logger.info("✅ Successfully clicked LIVE tab.")
 
             current_page_url = page.url
 
             self.logger.info("📜 Scrolling down on current tab to load all matches...")
+            # Keep scrolling only while the page is still growing (lazy-loaded rows)
+            last_height = 0
+            unchanged_scrolls = 0
             for i in range(15):
-                await page.evaluate("window.scrollBy(0, window.innerHeight * 1.5)")
-                self.logger.debug(f"Scroll attempt {i + 1}")
-                await page.wait_for_timeout(1000)
+                page_height = await page.evaluate(
+                    "() => { window.scrollBy(0, window.innerHeight * 1.5); return document.body.scrollHeight; }")
+                self.logger.debug(f"Scroll attempt {i + 1} (height {page_height})")
+                unchanged_scrolls = unchanged_scrolls + 1 if page_height == last_height else 0
+                if unchanged_scrolls >= 2:
+                    break
+                last_height = page_height
+                await page.wait_for_timeout(250)
 
-            league_header_selector = "div.wcl-header_uBhYi.wclLeagueHeader"
-            all_league_headers = await page.query_selector_all(league_header_selector)
+            # One round trip for every header and match row instead of a dozen per match
+            all_league_headers: List[Dict[str, Any]] = await page.evaluate(
+                self.EXTRACT_LIVE_MATCHES_JS, [self.MAX_HEADERS_TO_CHECK, bookmaker_id_to_check]
+            )
+            scraped_at = datetime.now(timezone.utc)  # One snapshot, one timestamp for all its matches
 
             self.logger.info(
-                f"Found {len(all_league_headers)} league headers using selector: '{league_header_selector}'. Will check up to {self.MAX_HEADERS_TO_CHECK}.")
+                f"Found {len(all_league_headers)} league headers (checking up to {self.MAX_HEADERS_TO_CHECK}).")
 
             itf_bet365_matches_count = 0
 
-            for header_idx, header_element in enumerate(all_league_headers[:self.MAX_HEADERS_TO_CHECK]):
+            for header_idx, header_data in enumerate(all_league_headers):
                 processed_headers_count += 1
                 if itf_bet365_matches_count >= self.MAX_MATCHES_TO_PROCESS:
                     self.logger.info(
                         f"Reached ITF MEN-SINGLES match limit ({self.MAX_MATCHES_TO_PROCESS}). Stopping header processing.")
                     break
 
-                title_box_el = await header_element.query_selector("div.event__titleBox")
-                current_tournament_name = ""
-                if title_box_el:
-                    part1_el = await title_box_el.query_selector("span.wcl-overline_rOFfd")
-                    part2_el = await title_box_el.query_selector("a.wcl-link_bLtj3")
-                    part1_text = (await part1_el.text_content() or "").strip() if part1_el else ""
-                    part2_text = (await part2_el.text_content() or "").strip() if part2_el else ""
-                    if part1_text and part2_text:
-                        current_tournament_name = f"{part1_text}: {part2_text}"
-                    elif part1_text:
-                        current_tournament_name = part1_text
-                    elif part2_text:
-                        current_tournament_name = part2_text
-
+                current_tournament_name = header_data['name']
                 self.logger.info(f"Header Idx {header_idx}: Extracted Name: '{current_tournament_name}'")
 
                 name_lower = current_tournament_name.lower()
@@ -453,84 +677,36 @@ class FlashscoreScraper(BaseScraper):
 
                 self.logger.info(
                     f"--- Identified ITF MEN - SINGLES Tournament: '{current_tournament_name}'. Looking for matches... ---")
-
-                # Get match elements under the current header
-                match_elements_js_handle: Optional[JSHandle] = await page.evaluate_handle(
-                    """(headerEl) => {
-                        const matches = [];
-                        let nextSibling = headerEl.nextElementSibling;
-                        while (nextSibling) {
-                            if (nextSibling.matches('div.wcl-header_uBhYi.wclLeagueHeader')) { break; } // Stop at next header
-                            // Check for common match row selectors
-                            if (nextSibling.matches('a.eventRowLink, div.event__match, div.event__match--scheduled, div.event__match--live, div.event__match--static')) {
-                                matches.push(nextSibling);
-                            }
-                            nextSibling = nextSibling.nextElementSibling;
-                        }
-                        return matches; // Returns an array of HTMLElements
-                    }""",
-                    header_element
-                )
-
-                if not match_elements_js_handle:
-                    self.logger.warning(
-                        f"Could not get match_elements_js_handle for header '{current_tournament_name}'")
-                    await header_element.dispose()  # Dispose the header element if we can't process its children
-                    continue
-
-                count_matches_under_header = await match_elements_js_handle.evaluate('arr => arr.length')
                 self.logger.info(
-                    f"Found {count_matches_under_header} match elements directly under '{current_tournament_name}'.")
+                    f"Found {len(header_data['matches'])} match elements directly under '{current_tournament_name}'.")
 
-                for i in range(count_matches_under_header):
+                for match_data in header_data['matches']:
                     if itf_bet365_matches_count >= self.MAX_MATCHES_TO_PROCESS:
                         self.logger.info(f"Reached ITF MEN-SINGLES match limit within '{current_tournament_name}'.")
                         break
 
-                    # Get individual match element handle from the JS array handle
-                    match_element_js_handle_item: Optional[JSHandle] = await match_elements_js_handle.evaluate_handle(
-                        '(arr, index) => arr[index]',
-                        i
+                    processed_match_elements_total += 1
+                    match_obj = await self._process_match_from_live_tab(
+                        match_data,
+                        current_tournament_name,
+                        processed_match_elements_total,
+                        # Use a global index for logging this specific processing step
+                        bookmaker_id_to_check,
+                        current_page_url,
+                        source_name,
+                        scraped_at
                     )
-
-                    if not match_element_js_handle_item:
-                        self.logger.warning(
-                            f"Could not get match_element_js_handle_item at index {i} for header '{current_tournament_name}'")
-                        continue
-
-                    match_element_handle = match_element_js_handle_item.as_element()
-
-                    if match_element_handle:
-                        processed_match_elements_total += 1
-                        match_obj = await self._process_match_from_live_tab(
-                            match_element_handle,
-                            current_tournament_name,
-                            processed_match_elements_total,
-                            # Use a global index for logging this specific processing step
-                            bookmaker_id_to_check,
-                            current_page_url
-                        )
-                        if match_obj:
-                            itf_bet365_matches_count += 1
-                            matches_found.append(match_obj)
-                            if progress_callback:
-                                await progress_callback(match_obj)
-                            if match_obj.metadata.get('is_match_tie_break'):
-                                self.logger.critical(
-                                    f"ITF MEN-SINGLES TIE BREAK #{itf_bet365_matches_count}: {match_obj.home_player.name} vs {match_obj.away_player_name} from '{match_obj.tournament}'")
-                            else:
-                                self.logger.info(
-                                    f"ITF MEN-SINGLES BET365 MATCH #{itf_bet365_matches_count}: {match_obj.home_player.name} vs {match_obj.away_player.name} from '{match_obj.tournament}'")
-                        # Dispose individual item handle after processing if it's an ElementHandle
-                        # No, match_element_handle is the ElementHandle, match_element_js_handle_item is its JSHandle wrapper
-                        await match_element_js_handle_item.dispose()
-                    else:
-                        self.logger.warning(
-                            f"match_element_js_handle_item at index {i} could not be converted to ElementHandle.")
-                        await match_element_js_handle_item.dispose()  # Still dispose the JSHandle
-
-                await match_elements_js_handle.dispose()  # Dispose the JSHandle for the array of matches
-                await header_element.dispose()  # Dispose the header element handle
+                    if match_obj:
+                        itf_bet365_matches_count += 1
+                        matches_found.append(match_obj)
+                        if progress_callback:
+                            await progress_callback(match_obj)
+                        if match_obj.metadata.get('is_match_tie_break'):
+                            self.logger.critical(
+                                f"ITF MEN-SINGLES TIE BREAK #{itf_bet365_matches_count}: {match_obj.home_player.name} vs {match_obj.away_player.name} from '{match_obj.tournament}'")
+                        else:
+                            self.logger.info(
+                                f"ITF MEN-SINGLES BET365 MATCH #{itf_bet365_matches_count}: {match_obj.home_player.name} vs {match_obj.away_player.name} from '{match_obj.tournament}'")
 
             success = True
             self.logger.info(
@@ -547,11 +723,14 @@ class FlashscoreScraper(BaseScraper):
             self.logger.error(f"❌ Scraping error: {e}", exc_info=True)
             error_message = str(e)
             success = False
+            # The browser may have crashed; launch a fresh one next cycle
+            page = None
+            try:
+                await self.shutdown()
+            except Exception:
+                self.logger.debug("Browser shutdown after error failed.")
         finally:
             if page: await page.close()
-            if context: await context.close()
-            if browser: await browser.close()
-            if playwright: await playwright.stop()
 
         duration = (datetime.now(timezone.utc) - start_time_dt).total_seconds()
         return ScrapingResult(
@@ -575,4 +754,5 @@ class FlashscoreScraper(BaseScraper):
 
     async def cleanup(self):
         self.logger.info("🧹 Cleaning up FlashscoreScraper...")
+        await self.shutdown()
         await super().cleanup()
\ No newline at end of file
@@ -45,6 +45,11 @@ class SofascoreScraper(BaseScraper):
         ]
     }
 
+    # Tournament endpoints are fetched concurrently, at most this many at a time; request starts to the
+    # API host are still spaced delay_between_requests apart (see BaseScraper._wait_for_host_slot)
+    MAX_CONCURRENT_REQUESTS = 4
+    EVENTS_CACHE_TTL = 30  # Tournament event lists, reused by a retry or quick refresh
+
     async def get_source_name(self) -> str:
         """Return the name of this scraping source."""
         return "sofascore"
@@ -64,14 +69,16 @@ class SofascoreScraper(BaseScraper):
         try:
             self.logger.info("Starting SofaScore scraping...")
 
-            men_matches = await self._scrape_category("men")
+            # Total time is the slowest endpoint rather than the sum of all of them
+            request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            scraped_at = datetime.now(timezone.utc)  # One timestamp for every match of this scrape
+            men_matches, women_matches = await asyncio.gather(
+                self._scrape_category("men", request_slots, scraped_at),
+                self._scrape_category("women", request_slots, scraped_at)
+            )
             api_calls_count += len(self.ITF_TOURNAMENT_IDS.get("men", []))
-            all_matches.extend(men_matches)
-
-            await asyncio.sleep(self.delay_between_requests)  # Delay between categories
-
-            women_matches = await self._scrape_category("women")
             api_calls_count += len(self.ITF_TOURNAMENT_IDS.get("women", []))
+            all_matches.extend(men_matches)
             all_matches.extend(women_matches)
 
             success = True
@@ -96,7 +103,8 @@ class SofascoreScraper(BaseScraper):
             }
         )
 
-    async def _scrape_category(self, category: str) -> List[TennisMatch]:
+    async def _scrape_category(self, category: str, request_slots: asyncio.Semaphore,
+                               scraped_at: datetime) -> List[TennisMatch]:
         """Scrape matches from a specific category (men/women)."""
         matches_in_category: List[TennisMatch] = []
         tournament_ids = self.ITF_TOURNAMENT_IDS.get(category, [])
@@ -107,7 +115,21 @@ class SofascoreScraper(BaseScraper):
 
         self.logger.info(f"Scraping SofaScore {category} tournaments: {tournament_ids}")
 
-        for tournament_id in tournament_ids:
+        tournament_matches = await asyncio.gather(
+            *(self._scrape_tournament(category, tournament_id, request_slots, scraped_at)
+              for tournament_id in tournament_ids)
+        )
+        for matches in tournament_matches:
+            matches_in_category.extend(matches)
+
+        self.logger.info(f"Found {len(matches_in_category)} matches for SofaScore category: {category}")
+        return matches_in_category
+
+    async def _scrape_tournament(self, category: str, tournament_id: int,
+                                 request_slots: asyncio.Semaphore, scraped_at: datetime) -> List[TennisMatch]:
+        """Fetch and parse the events of one tournament; errors are logged and yield no matches."""
+        matches: List[TennisMatch] = []
+        async with request_slots:
             try:
                 # API endpoint for events in a tournament for a specific date (today)
                 # Sofascore API might require a date; using today's date.
@@ -118,19 +140,14 @@ class SofascoreScraper(BaseScraper):
                 # The endpoint /last/0 usually gives recent and upcoming.
                 events_url = f"{self.API_BASE}/unique-tournament/{tournament_id}/events/last/0"
 
-                session = await self._get_session()
-                async with session.get(events_url, timeout=self.request_timeout) as response:
-                    response.raise_for_status()  # Will raise an error for 4xx/5xx responses
-                    data = await response.json()
-                    events = data.get('events', [])
-                    self.logger.debug(f"Fetched {len(events)} events for tournament ID {tournament_id} ({category}).")
+                data = json.loads(await self._fetch_text(events_url, ttl=self.EVENTS_CACHE_TTL, paced=True))
+                events = data.get('events', [])
+                self.logger.debug(f"Fetched {len(events)} events for tournament ID {tournament_id} ({category}).")
 
-                    for event_data in events:
-                        match = self._parse_event_data(event_data, category, tournament_id)
-                        if match:
-                            matches_in_category.append(match)
-
-                await asyncio.sleep(self.delay_between_requests)  # Delay between individual tournament API calls
+                for event_data in events:
+                    match = self._parse_event_data(event_data, category, tournament_id, scraped_at)
+                    if match:
+                        matches.append(match)
 
             except aiohttp.ClientResponseError as e_http:
                 self.logger.warning(
@@ -141,10 +158,10 @@ class SofascoreScraper(BaseScraper):
                 self.logger.error(f"Failed to scrape SofaScore tournament {tournament_id} ({category}): {e}",
                                   exc_info=True)
 
-        self.logger.info(f"Found {len(matches_in_category)} matches for SofaScore category: {category}")
-        return matches_in_category
+        return matches
 
-    def _parse_event_data(self, event: Dict[str, Any], category_type: str, tour_id: int) -> Optional[TennisMatch]:
+    def _parse_event_data(self, event: Dict[str, Any], category_type: str, tour_id: int,
+                          scraped_at: datetime) -> Optional[TennisMatch]:
         """Parse event data from Sofascore API into TennisMatch object."""
         try:
             home_team = event.get('homeTeam', {})
@@ -239,7 +256,7 @@ class SofascoreScraper(BaseScraper):
                 source="sofascore",  # Not ideal, set explicitly
                 source_url=source_url_val,
                 match_id=match_id_val,
-                last_updated=datetime.now(timezone.utc),
+                last_updated=scraped_at,
                 metadata={
                     'sofascore_event_id': event.get('id'),
                     'sofascore_tournament_id': tournament_info.get('tournament', {}).get('id', tour_id),
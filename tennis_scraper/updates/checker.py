@@ -3,15 +3,36 @@ Update checking functionality.
 """
 
 import asyncio
+import json
+import re
+import time
 import aiohttp
-from dataclasses import dataclass, asdict  # Added asdict
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from packaging.version import Version, InvalidVersion
+from dataclasses import dataclass, asdict, field  # Added asdict
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from ..core.interfaces import UpdateChecker as CoreUpdateCheckerInterface  # Aliased to avoid name clash
 from ..utils.logging import get_logger
 from .. import __version__ as app_current_version  # Get current version from package
 
+# Changelog words that mark a release as critical, matched in one case-insensitive pass
+_CRITICAL_RE = re.compile(r"critical|security|urgent|hotfix|vulnerability", re.IGNORECASE)
+
+# Small release files fetched next to the installer; other assets (e.g. the .zst copy) are left alone
+SIDECAR_SUFFIXES = (".sha256", ".sig", ".asc")
+SIDECAR_MAX_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=32)
+def _parse_version(version: str) -> Optional[Version]:
+    """PEP 440 version for a release tag (handles rc/dev/local parts); None if unparseable."""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
 
 @dataclass
 class UpdateInfo:
@@ -23,6 +44,8 @@ class UpdateInfo:
     critical: bool = False
     min_version: Optional[str] = None  # Made optional
     file_size: int = 0  # In bytes
+    sha256: Optional[str] = None  # Expected hex digest of the download, when the release provides one
+    sidecar_urls: List[str] = field(default_factory=list)  # Checksum and signature assets of the release
     # Optional: add a field for the local path if downloaded
     local_file_path: Optional[str] = None
 
@@ -39,6 +62,11 @@ class UpdateInfo:
 class GitHubUpdateChecker(CoreUpdateCheckerInterface):  # Inherit from the core interface
     """Update checker using GitHub releases API."""
 
+    # Successful results are reused for a while, across checker instances and app restarts
+    CACHE_TTL_SECONDS = 600
+    CACHE_SETTINGS_KEY = "updates/last_check_json"
+    _session_cache: Dict[str, Dict[str, Any]] = {}  # update_url -> cache entry
+
     def __init__(self, config: Any): # Changed type hint to Any, as it's an UpdateConfig instance
         # config here is an instance of UpdateConfig dataclass
         self.config_obj = config # Store the UpdateConfig instance
@@ -56,19 +84,87 @@ class GitHubUpdateChecker(CoreUpdateCheckerInterface):  # Inherit from the core
 
         self.current_version = app_current_version  # Use the package's version
 
-    async def check_for_updates(self) -> Optional[UpdateInfo]:
-        """Check if updates are available."""
+    def _load_cache_entry(self) -> Optional[Dict[str, Any]]:
+        """Returns the cached check of this URL and version, fresh or stale, if any."""
+        entry = self._session_cache.get(self.update_url)
+        if entry is None:
+            try:
+                from ..utils.settings import SettingsManager
+                raw = SettingsManager().get(self.CACHE_SETTINGS_KEY)
+                entry = json.loads(raw) if raw else None
+            except Exception as e:
+                self.logger.debug(f"Could not read persisted update check: {e}")
+                entry = None
+
+        if (not entry or entry.get("update_url") != self.update_url
+                or entry.get("current_version") != self.current_version):
+            return None
+
+        self._session_cache[self.update_url] = entry
+        return entry
+
+    @staticmethod
+    def _cached_info(entry: Dict[str, Any]) -> Optional[UpdateInfo]:
+        update_info = entry.get("update_info")
+        return UpdateInfo.from_dict(update_info) if update_info else None
+
+    def _store_result(self, update_info: Optional[UpdateInfo], etag: Optional[str] = None,
+                      last_modified: Optional[str] = None) -> Optional[UpdateInfo]:
+        """Caches a successful check result (None meaning up to date) and returns it."""
+        entry = {
+            "update_url": self.update_url,
+            "current_version": self.current_version,
+            "checked_at": time.time(),
+            "update_info": update_info.to_dict() if update_info else None,
+            # Validators for a conditional request once the entry has gone stale
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._session_cache[self.update_url] = entry
+        try:
+            from ..utils.settings import SettingsManager
+            SettingsManager().set(self.CACHE_SETTINGS_KEY, json.dumps(entry))
+        except Exception as e:
+            self.logger.debug(f"Could not persist update check: {e}")
+        return update_info
+
+    async def check_for_updates(self, session: Optional[aiohttp.ClientSession] = None) -> Optional[UpdateInfo]:
+        """Check if updates are available. Uses the given session (kept open) or a throwaway one."""
+        entry = self._load_cache_entry()
+        if entry and time.time() - entry.get("checked_at", 0) < self.CACHE_TTL_SECONDS:
+            cached_info = self._cached_info(entry)
+            self.logger.info(
+                f"Using update check result from the last {self.CACHE_TTL_SECONDS // 60} minutes "
+                f"({'update ' + cached_info.version if cached_info else 'up to date'}).")
+            return cached_info
+
+        # Stale cache: ask GitHub whether the release changed; a 304 carries no body and keeps our result
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
         try:
             self.logger.info(
                 f"Checking for updates from {self.update_url} (current version: {self.current_version})...")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.update_url, timeout=10) as response:
+            own_session = session is None
+            if own_session:
+                session = aiohttp.ClientSession()
+            try:
+                async with session.get(self.update_url, timeout=10, headers=headers) as response:
+                    if response.status == 304 and entry:
+                        self.logger.info("Latest release unchanged since the last check (304 Not Modified).")
+                        return self._store_result(self._cached_info(entry), entry.get("etag"),
+                                                  entry.get("last_modified"))
+
                     if response.status != 200:
                         self.logger.error(
                             f"GitHub API request failed with status {response.status}: {await response.text()}")
                         return None
 
+                    etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
                     data = await response.json()
                     latest_version_tag = data.get("tag_name")
                     if not latest_version_tag:
@@ -77,10 +173,15 @@ class GitHubUpdateChecker(CoreUpdateCheckerInterface):  # Inherit from the core
 
                     latest_version = latest_version_tag.lstrip('v')
 
-                    if self._compare_versions(latest_version, self.current_version) > 0:
+                    comparison = self._compare_versions(latest_version, self.current_version)
+                    if comparison is None:
+                        return None  # Not cached: a later check may see a release with a readable tag
+
+                    if comparison > 0:
                         self.logger.info(f"New version found: {latest_version}")
                         download_url = None
                         file_size = 0
+                        sha256 = None
                         primary_asset_name_suffix = ".exe"
 
                         for asset in data.get("assets", []):
@@ -88,27 +189,39 @@ class GitHubUpdateChecker(CoreUpdateCheckerInterface):  # Inherit from the core
                             if asset_name.endswith(primary_asset_name_suffix):
                                 download_url = asset.get("browser_download_url")
                                 file_size = asset.get("size", 0)
+                                sha256 = self._asset_sha256(asset)
                                 break
 
                         if not download_url and data.get("assets"):
                             first_asset = data["assets"][0]
                             download_url = first_asset.get("browser_download_url")
                             file_size = first_asset.get("size", 0)
+                            sha256 = self._asset_sha256(first_asset)
                             self.logger.warning(
                                 f"Primary asset type '{primary_asset_name_suffix}' not found, using first asset: {first_asset.get('name')}")
 
-                        return UpdateInfo(
+                        sidecar_urls = [asset["browser_download_url"] for asset in data.get("assets", [])
+                                        if asset.get("name", "").lower().endswith(SIDECAR_SUFFIXES)
+                                        and asset.get("browser_download_url")
+                                        and asset.get("size", 0) <= SIDECAR_MAX_BYTES]
+
+                        return self._store_result(UpdateInfo(
                             version=latest_version,
                             build_date=data.get("published_at"),
                             download_url=download_url,
                             changelog=data.get("body"),
                             critical=self._is_critical_update(data.get("body", "")),
-                            file_size=file_size
-                        )
+                            file_size=file_size,
+                            sha256=sha256,
+                            sidecar_urls=sidecar_urls
+                        ), etag, last_modified)
                     else:
                         self.logger.info(
                             f"Current version {self.current_version} is up to date (latest: {latest_version}).")
-                        return None
+                        return self._store_result(None, etag, last_modified)
+            finally:
+                if own_session:
+                    await session.close()
 
         except aiohttp.ClientError as e:
             self.logger.error(f"Network error during update check: {e}")
@@ -132,25 +245,21 @@ class GitHubUpdateChecker(CoreUpdateCheckerInterface):  # Inherit from the core
             self.logger.error(f"Update download initiation failed from checker: {e}")
             return None
 
+    @staticmethod
+    def _asset_sha256(asset: Dict[str, Any]) -> Optional[str]:
+        """SHA-256 that GitHub reports for a release asset ("digest": "sha256:<hex>"), if present."""
+        digest = asset.get("digest") or ""
+        return digest[len("sha256:"):].lower() if digest.startswith("sha256:") else None
+
     def _is_critical_update(self, changelog: str) -> bool:
         if not changelog: return False
-        critical_keywords = ["critical", "security", "urgent", "hotfix", "vulnerability"]
-        return any(keyword in changelog.lower() for keyword in critical_keywords)
+        return bool(_CRITICAL_RE.search(changelog))
 
-    def _compare_versions(self, version1: str, version2: str) -> int:
-        def version_to_tuple(v):
-            try:
-                return tuple(map(int, v.split('.')))
-            except ValueError:
-                self.logger.warning(f"Could not parse version string '{v}' for comparison. Assuming older.")
-                return (0, 0, 0)
-
-        v1_tuple = version_to_tuple(version1)
-        v2_tuple = version_to_tuple(version2)
-
-        if v1_tuple > v2_tuple:
-            return 1
-        elif v1_tuple < v2_tuple:
-            return -1
-        else:
-            return 0
\ No newline at end of file
+    def _compare_versions(self, version1: str, version2: str) -> Optional[int]:
+        """1, 0 or -1 as version1 is newer, equal or older; None if either can't be parsed."""
+        v1, v2 = _parse_version(version1), _parse_version(version2)
+        if v1 is None or v2 is None:
+            unparseable = version1 if v1 is None else version2
+            self.logger.warning(f"Could not parse version string '{unparseable}', skipping the update decision.")
+            return None
+        return (v1 > v2) - (v1 < v2)
@@ -1,25 +1,34 @@
 import asyncio
+import hashlib
+import os
 import aiohttp
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import Optional, Callable
 
-from .checker import UpdateInfo
+from .checker import UpdateInfo, SIDECAR_MAX_BYTES
 from ..utils.logging import get_logger
 
 
 class UpdateDownloader:
     """Handles downloading updates."""
 
+    MIN_CHUNK_SIZE = 64 * 1024
+    MAX_CHUNK_SIZE = 1024 * 1024
+    DEFAULT_CHUNK_SIZE = 256 * 1024  # When the server sends no Content-Length
+
     def __init__(self):
         self.logger = get_logger(__name__)
 
-    async def download(self, update_info: UpdateInfo, progress_callback: Optional[Callable] = None) -> Optional[str]:
+    async def download(self, update_info: UpdateInfo, progress_callback: Optional[Callable] = None,
+                       session: Optional[aiohttp.ClientSession] = None) -> Optional[str]:
         """
         Download update file.
 
         Args:
             update_info: Information about the update
             progress_callback: Optional callback for progress updates (0-100)
+            session: Optional shared session (left open); a throwaway one is used otherwise
 
         Returns:
             Path to downloaded file, or None if failed
@@ -34,26 +43,89 @@ class UpdateDownloader:
 
             self.logger.info(f"Downloading update to {filepath}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(update_info.download_url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Download failed with status {response.status}")
-
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
+            own_session = session is None
+            if own_session:
+                session = aiohttp.ClientSession()
+            try:
+                # Checksum and signature files come down alongside the installer, overlapping their round trips
+                digest, *_ = await asyncio.gather(
+                    self._download_installer(session, update_info.download_url, filepath, progress_callback),
+                    *(self._fetch_sidecar(session, url, updates_dir) for url in update_info.sidecar_urls))
+            finally:
+                if own_session:
+                    await session.close()
 
-                    with open(filepath, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
-                            downloaded += len(chunk)
+            if update_info.sha256 and digest != update_info.sha256:
+                filepath.unlink(missing_ok=True)
+                raise Exception(f"Checksum mismatch: expected {update_info.sha256}, got {digest}")
 
-                            if progress_callback and total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
-                                progress_callback(progress)
-
-            self.logger.info(f"Download completed: {filepath}")
+            self.logger.info(f"Download completed: {filepath} (sha256 {digest})")
             return str(filepath)
 
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def _download_installer(self, session: aiohttp.ClientSession, url: str, filepath: Path,
+                                  progress_callback: Optional[Callable]) -> str:
+        """Streams the installer to filepath, reporting progress; returns its SHA-256 hex digest."""
+        # A read buffer as large as the biggest chunk lets the socket drain in big blocks;
+        # with aiohttp's 64 KiB default, large chunk reads still come back in small pieces
+        async with session.get(url, read_bufsize=self.MAX_CHUNK_SIZE) as response:
+            if response.status != 200:
+                raise Exception(f"Download failed with status {response.status}")
+
+            total_size = int(response.headers.get('content-length', 0))
+            downloaded = 0
+            last_progress = -1
+
+            # Roughly 1% of the file per chunk: far fewer writes and loop iterations than 8 KiB reads
+            chunk_size = (min(self.MAX_CHUNK_SIZE, max(self.MIN_CHUNK_SIZE, total_size // 100))
+                          if total_size > 0 else self.DEFAULT_CHUNK_SIZE)
+
+            # Hashed while writing, so verifying the download needs no second pass over the file
+            sha256 = hashlib.sha256()
+            with open(filepath, 'wb') as f:
+                if total_size > 0:
+                    self._preallocate(f, total_size)
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    sha256.update(chunk)
+                    f.write(chunk)
+                    downloaded += len(chunk)
+
+                    if progress_callback and total_size > 0:
+                        progress = int((downloaded / total_size) * 100)
+                        if progress != last_progress:  # Each callback is a signal across threads
+                            progress_callback(progress)
+                            last_progress = progress
+                f.truncate(downloaded)  # Drop any preallocated space a short response never filled
+        return sha256.hexdigest()
+
+    async def _fetch_sidecar(self, session: aiohttp.ClientSession, url: str, updates_dir: Path) -> Optional[Path]:
+        """Downloads a small release file (checksum, signature) next to the installer; failures are only logged."""
+        dest = updates_dir / Path(urlparse(url).path).name
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise Exception(f"status {response.status}")
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(SIDECAR_MAX_BYTES):
+                    data += chunk
+                    if len(data) > SIDECAR_MAX_BYTES:  # Never buffer an unexpectedly large asset
+                        raise Exception(f"larger than {SIDECAR_MAX_BYTES} bytes")
+                dest.write_bytes(data)
+            self.logger.debug(f"Fetched release file {dest}")
+            return dest
+        except Exception as e:
+            self.logger.warning(f"Could not fetch release file {url}: {e}")
+            return None
+
+    def _preallocate(self, f, size: int):
+        """Reserves the whole file up front so the filesystem lays it out once instead of growing it per chunk."""
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(f.fileno(), 0, size)
+            else:
+                f.truncate(size)  # SetEndOfFile on Windows: NTFS allocates the clusters without zero-filling
+        except OSError as e:
+            self.logger.debug(f"Could not preallocate {size} bytes, writing without it: {e}")
\ No newline at end of file
@@ -3,7 +3,6 @@ Utility modules and helper functions.
 """
 
 from .logging import get_logger, setup_logging, PerformanceLogger, TimedContext
-from .settings import SettingsManager
 from .export import CSVExporter, JSONExporter
 from .validators import URLValidator, VersionValidator
 
@@ -11,4 +10,12 @@ __all__ = [
     "get_logger", "setup_logging", "PerformanceLogger", "TimedContext",
     "SettingsManager", "CSVExporter", "JSONExporter",
     "URLValidator", "VersionValidator"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # SettingsManager needs PySide6; don't load Qt just to get at the plain helpers
+    if name == "SettingsManager":
+        from .settings import SettingsManager
+        return SettingsManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,6 +1,5 @@
 import csv
 import json
-# import pandas as pd # Import pandas if ExcelExporter is re-enabled and uses it
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Optional
 from datetime import datetime, timezone
@@ -98,8 +97,18 @@ class JSONExporter(DataExporter):
                 'matches': [match.to_dict() for match in matches]  # Use the model's to_dict
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=indent, ensure_ascii=False)
+            # orjson encodes in one C pass (UTF-8, like ensure_ascii=False) but only indents by 2
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+
+            if orjson is not None and indent in (None, 2):
+                option = orjson.OPT_INDENT_2 if indent == 2 else 0
+                Path(output_path).write_bytes(orjson.dumps(export_data, option=option))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=indent, ensure_ascii=False)
 
             self.logger.info(f"Exported {len(matches)} matches to JSON: {output_path}")
             return True
@@ -120,60 +129,68 @@ class ExcelExporter(DataExporter):
 
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.pd = None  # Lazy load pandas
+        self.openpyxl = None  # Lazy load openpyxl
 
-    async def _lazy_load_pandas(self):
-        if self.pd is None:
+    async def _lazy_load_openpyxl(self):
+        if self.openpyxl is None:
             try:
-                import pandas
-                self.pd = pandas
+                import openpyxl
+                self.openpyxl = openpyxl
             except ImportError:
                 self.logger.error(
-                    "Pandas library is not installed. Excel export unavailable. Run: pip install pandas openpyxl")
-                raise RuntimeError("Pandas not installed, required for Excel export.")
+                    "openpyxl library is not installed. Excel export unavailable. Run: pip install openpyxl")
+                raise RuntimeError("openpyxl not installed, required for Excel export.")
+
+    @staticmethod
+    def _cell_value(key: str, value: Any) -> Any:
+        """Converts a flattened field into something a worksheet cell can hold."""
+        if key == 'score_sets' and isinstance(value, (list, tuple)):
+            return " ".join([f"{s[0]}-{s[1]}" for s in value])
+        if key == 'score_current_game' and isinstance(value, (list, tuple)) and len(value) == 2:
+            return f"{value[0]}-{value[1]}"
+        if isinstance(value, (list, tuple, dict)):
+            return str(value)
+        return value
 
     async def export_matches(self, matches: List[TennisMatch], output_path: str, **kwargs) -> bool:
-        await self._lazy_load_pandas()
-        if not self.pd: return False
-
         try:
-            # Convert matches to list of dicts for DataFrame
-            data_for_df = [match.to_dict() for match in matches]
+            # Written with openpyxl directly; building a pandas DataFrame just to save a sheet is far heavier
+            await self._lazy_load_openpyxl()
+            from openpyxl.utils import get_column_letter
 
             # Flatten nested player and score dicts for easier Excel viewing
             flat_data = []
-            for record in data_for_df:
+            for record in (match.to_dict() for match in matches):
                 flat_record = {}
                 for key, value in record.items():
                     if isinstance(value, dict):
                         for sub_key, sub_value in value.items():
-                            flat_record[f"{key}_{sub_key}"] = sub_value
+                            flat_key = f"{key}_{sub_key}"
+                            flat_record[flat_key] = self._cell_value(flat_key, sub_value)
                     else:
-                        flat_record[key] = value
+                        flat_record[key] = self._cell_value(key, value)
                 flat_data.append(flat_record)
 
-            df = self.pd.DataFrame(flat_data)
+            # Union of all keys in first-seen order, like a DataFrame built from the records
+            columns = list(dict.fromkeys(key for record in flat_data for key in record))
+            rows = [[record.get(column) for column in columns] for record in flat_data]
 
-            # Clean up some column names if necessary, e.g. score_sets list to string
-            if 'score_sets' in df.columns:
-                df['score_sets'] = df['score_sets'].apply(
-                    lambda x: " ".join([f"{s[0]}-{s[1]}" for s in x]) if isinstance(x, list) else x)
-            if 'score_current_game' in df.columns:
-                df['score_current_game'] = df['score_current_game'].apply(
-                    lambda x: f"{x[0]}-{x[1]}" if isinstance(x, list) and len(x) == 2 else x)
+            workbook = self.openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Tennis Matches')
+            # Auto-adjust column widths (basic implementation); must be set before rows in write-only mode
+            for col_idx, column in enumerate(columns, start=1):
+                length = max([len(column)] + [len(str(row[col_idx - 1])) for row in rows if row[col_idx - 1] is not None])
+                worksheet.column_dimensions[get_column_letter(col_idx)].width = min(length + 2, 50)
 
-            with self.pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Tennis Matches', index=False)
-                # Auto-adjust column widths (basic implementation)
-                worksheet = writer.sheets['Tennis Matches']
-                for column_cells in worksheet.columns:
-                    length = max(len(str(cell.value)) for cell in column_cells)
-                    worksheet.column_dimensions[column_cells[0].column_letter].width = min(length + 2, 50)
+            worksheet.append(columns)
+            for row in rows:
+                worksheet.append(row)
+            workbook.save(output_path)
 
             self.logger.info(f"Exported {len(matches)} matches to Excel: {output_path}")
             return True
 
-        except RuntimeError as r_err:  # Catch pandas not installed
+        except RuntimeError as r_err:  # Catch openpyxl not installed
             self.logger.error(str(r_err))
             return False
         except Exception as e:
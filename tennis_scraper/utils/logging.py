@@ -19,8 +19,8 @@ DEFAULT_LOG_FORMAT = (
     "%(asctime)s - %(levelname)-8s - [%(name)s:%(funcName)s:%(lineno)d] - %(message)s"
 )
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-MAX_LOG_FILE_SIZE_MB = 10
-LOG_BACKUP_COUNT = 5
+MAX_LOG_FILE_SIZE_MB = 5  # Matches LoggingConfig defaults
+LOG_BACKUP_COUNT = 3
 
 _logging_configured = False
 
@@ -45,19 +45,19 @@ def setup_logging(
     formatter = logging.Formatter(log_format, date_format)
     root_logger = logging.getLogger()
 
-    # Prevent re-configuring if already done by another part of the app that imports this.
-    # A more robust way might involve checking root_logger.hasHandlers(),
-    # but this flag is simpler for now.
-    if (
-        _logging_configured
-        and root_logger.level == numeric_level
-        and len(root_logger.handlers) > 0
-    ):
-        # If level is the same and handlers exist, assume it's configured.
-        # This might need adjustment if config changes log level at runtime.
-        logging.getLogger(__name__).debug(
-            "Logging setup skipped, seems already configured."
-        )
+    # Handlers are only ever installed once. Later calls (e.g. the get_logger fallback
+    # followed by the explicit call at startup) just adjust the level, instead of
+    # closing and reopening the log file or stacking duplicate handlers.
+    if _logging_configured and root_logger.handlers:
+        if root_logger.level != numeric_level:
+            root_logger.setLevel(numeric_level)
+            logging.getLogger(__name__).info(
+                f"Log level changed to {log_level_upper}"
+            )
+        else:
+            logging.getLogger(__name__).debug(
+                "Logging setup skipped, already configured."
+            )
         return
 
     root_logger.setLevel(numeric_level)
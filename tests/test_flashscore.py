@@ -0,0 +1,91 @@
+"""
+Tests for the Flashscore data feed parser.
+"""
+
+import aiohttp
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from tennis_scraper.scrapers.flashscore import FlashscoreScraper
+from tennis_scraper.core.models import MatchStatus
+
+BET365_ID = "16"
+ITF_HEADER = "ZA÷ITF MEN - SINGLES: M15 Monastir (Tunisia), hard"
+
+
+def feed(*records: str) -> str:
+    """Builds a feed body from records of "¬"-separated fields."""
+    return "SA÷2¬~" + "¬~".join(records) + "¬~"
+
+
+class TestFlashscoreFeed:
+    """Test parsing of the Flashscore feed records."""
+
+    @pytest.fixture
+    def scraper(self, monkeypatch):
+        monkeypatch.setattr(FlashscoreScraper, "_feed_disabled", False)
+        return FlashscoreScraper({'request_timeout': 10, 'max_retries': 3, 'delay_between_requests': 1})
+
+    @pytest.mark.asyncio
+    async def test_live_bet365_match(self, scraper):
+        body = feed(ITF_HEADER,
+                    "AA÷abc123¬AB÷2¬AE÷Doe J.¬AF÷Smith K.¬BA÷6¬BB÷4¬BC÷3¬BD÷2¬OD÷2,16")
+
+        matches = await scraper._parse_feed(body, BET365_ID)
+
+        assert len(matches) == 1
+        match = matches[0]
+        assert match.match_id == "abc123"
+        assert match.home_player.name == "Doe J."
+        assert match.away_player.name == "Smith K."
+        assert match.score.sets == [(6, 4), (3, 2)]
+        assert match.status == MatchStatus.LIVE
+        assert match.metadata['from_feed'] is True
+
+    @pytest.mark.asyncio
+    async def test_bookmaker_must_be_listed(self, scraper):
+        # "116" contains "16" as text but is a different bookmaker
+        body = feed(ITF_HEADER, "AA÷abc123¬AB÷2¬AE÷Doe J.¬AF÷Smith K.¬OD÷2,116")
+
+        assert await scraper._parse_feed(body, BET365_ID) == []
+
+    @pytest.mark.asyncio
+    async def test_skips_other_tournaments_and_finished_matches(self, scraper):
+        body = feed("ZA÷ATP - SINGLES: Paris (France), hard",
+                    "AA÷atp1¬AB÷2¬AE÷A B.¬AF÷C D.¬OD÷16",
+                    ITF_HEADER,
+                    "AA÷done1¬AB÷3¬AE÷E F.¬AF÷G H.¬OD÷16",
+                    "AA÷live1¬AB÷2¬AE÷I J.¬AF÷K L.¬OD÷16")
+
+        matches = await scraper._parse_feed(body, BET365_ID)
+
+        assert [match.match_id for match in matches] == ["live1"]
+
+    @pytest.mark.asyncio
+    async def test_feed_without_odds_is_inconclusive(self, scraper):
+        body = feed(ITF_HEADER, "AA÷abc123¬AB÷2¬AE÷Doe J.¬AF÷Smith K.")
+
+        assert await scraper._parse_feed(body, BET365_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_unrecognised_body_disables_feed(self, scraper):
+        assert await scraper._parse_feed("<html>blocked</html>", BET365_ID) is None
+        assert FlashscoreScraper._feed_disabled
+
+    @pytest.mark.asyncio
+    async def test_rejected_sign_disables_feed(self, scraper):
+        rejected = aiohttp.ClientResponseError(request_info=Mock(), history=(), status=403)
+        with patch.object(scraper, '_fetch_text', AsyncMock(side_effect=rejected)) as fetch_text:
+            assert await scraper._scrape_from_feed(BET365_ID) is None
+            assert await scraper._scrape_from_feed(BET365_ID) is None
+
+        # The second scrape goes straight to the browser without requesting the feed again
+        assert fetch_text.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_keeps_feed(self, scraper):
+        failed = aiohttp.ClientResponseError(request_info=Mock(), history=(), status=503)
+        with patch.object(scraper, '_fetch_text', AsyncMock(side_effect=failed)):
+            assert await scraper._scrape_from_feed(BET365_ID) is None
+
+        assert not FlashscoreScraper._feed_disabled
@@ -0,0 +1,117 @@
+"""
+Tests for the matches table row diffing.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+
+from tennis_scraper.gui.components.matches_table import MatchesTable, _match_fingerprint, _match_key
+from tennis_scraper.core.models import TennisMatch, Player, Score, MatchStatus
+
+SCRAPED_AT = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    """A QApplication for widget tests (one per process)."""
+    return QApplication.instance() or QApplication([])
+
+
+def make_match(home, away, score="6-4 3-2", status=MatchStatus.LIVE, tie_break=False, match_id=None):
+    return TennisMatch(
+        home_player=Player(home),
+        away_player=Player(away),
+        score=Score.from_string(score),
+        status=status,
+        tournament="ITF Test Tournament",
+        source="test",
+        last_updated=SCRAPED_AT,
+        match_id=match_id,
+        metadata={'is_match_tie_break': tie_break}
+    )
+
+
+def row_texts(table, column):
+    return sorted(table.item(row, column).text() for row in range(table.rowCount()))
+
+
+@pytest.mark.gui
+class TestMatchesTable:
+    """Test incremental updates of the matches table."""
+
+    @pytest.fixture
+    def table(self, qt_app):
+        return MatchesTable()
+
+    def test_match_key_ignores_score(self):
+        before = make_match("John Doe", "Jane Smith", score="6-4")
+        after = make_match("John Doe", "Jane Smith", score="6-4 1-0")
+
+        assert _match_key(before) == _match_key(after)
+        assert _match_fingerprint(before) != _match_fingerprint(after)
+
+    def test_same_players_with_different_ids(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith", match_id="a1"),
+                              make_match("John Doe", "Jane Smith", score="1-0", match_id="b2")])
+
+        assert table.rowCount() == 2
+
+    def test_indistinguishable_matches_keep_own_rows(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith"),
+                              make_match("John Doe", "Jane Smith", score="1-0")])
+
+        assert table.rowCount() == 2
+
+        table.update_matches([make_match("John Doe", "Jane Smith")])
+
+        assert table.rowCount() == 1
+
+    def test_initial_fill(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith"), make_match("Bob Wilson", "Alice Brown")])
+
+        assert table.rowCount() == 2
+        assert table.get_match_count() == 2
+        assert row_texts(table, 1) == ["Bob Wilson", "John Doe"]
+
+    def test_changed_match_updates_row_in_place(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith", score="6-4 3-2")])
+        first_item = table.item(0, 0)
+
+        table.update_matches([make_match("John Doe", "Jane Smith", score="6-4 5-2")])
+
+        assert table.rowCount() == 1
+        assert table.item(0, 0) is first_item
+        assert "5-2" in table.item(0, 3).text()
+
+    def test_removed_and_added_matches(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith"), make_match("Bob Wilson", "Alice Brown")])
+
+        table.update_matches([make_match("John Doe", "Jane Smith"), make_match("Mike Johnson", "Sarah Davis")])
+
+        assert table.rowCount() == 2
+        assert row_texts(table, 1) == ["John Doe", "Mike Johnson"]
+        assert row_texts(table, 2) == ["Jane Smith", "Sarah Davis"]
+
+    def test_tie_break_restyles_row(self, table):
+        table.update_matches([make_match("John Doe", "Jane Smith")])
+        table.update_matches([make_match("John Doe", "Jane Smith", tie_break=True)])
+
+        assert table.item(0, 0).font().bold()
+
+        table.update_matches([make_match("John Doe", "Jane Smith")])
+
+        assert not table.item(0, 0).font().bold()
+
+    def test_unchanged_list_is_skipped(self, table):
+        matches = [make_match("John Doe", "Jane Smith")]
+        table.update_matches(matches)
+        first_item = table.item(0, 1)
+        first_item.setText("edited")
+
+        table.update_matches([make_match("John Doe", "Jane Smith")])
+
+        assert table.item(0, 1).text() == "edited"
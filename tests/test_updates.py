@@ -0,0 +1,147 @@
+"""
+Tests for update checking and downloading.
+"""
+
+import hashlib
+import sys
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from tennis_scraper.config import UpdateConfig
+from tennis_scraper.updates.checker import (
+    GitHubUpdateChecker, UpdateInfo, _CRITICAL_RE, _parse_version
+)
+from tennis_scraper.updates.downloader import UpdateDownloader
+from .conftest import AsyncContextManager
+
+
+class ChunkedContent:
+    """Stand-in for aiohttp's response.content that yields fixed chunks."""
+
+    def __init__(self, *chunks):
+        self.chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    """Checker with an empty result cache that never touches the real settings store."""
+    monkeypatch.setattr(GitHubUpdateChecker, "_session_cache", {})
+    with patch.dict(sys.modules, {"tennis_scraper.utils.settings": Mock()}):
+        yield GitHubUpdateChecker(UpdateConfig())
+
+
+class TestVersionParsing:
+    """Test release tag parsing and comparison."""
+
+    def test_parse_version(self):
+        assert _parse_version("1.2.10") > _parse_version("1.2.9")
+        assert _parse_version("2.0.0rc1") < _parse_version("2.0.0")
+        assert _parse_version("not-a-version") is None
+
+    def test_compare_versions(self, checker):
+        assert checker._compare_versions("1.3.0", "1.2.9") == 1
+        assert checker._compare_versions("1.2.0", "1.2") == 0
+        assert checker._compare_versions("1.0.0", "1.0.1") == -1
+
+    def test_compare_unparseable_version(self, checker):
+        assert checker._compare_versions("latest", "1.0.0") is None
+        assert checker._compare_versions("1.0.0", "") is None
+
+
+class TestCriticalUpdate:
+    """Test critical release detection from the changelog."""
+
+    def test_critical_keywords(self, checker):
+        assert _CRITICAL_RE.search("Fixes a SECURITY issue")
+        assert checker._is_critical_update("Urgent hotfix for login")
+        assert checker._is_critical_update("Patched a vulnerability")
+
+    def test_non_critical_changelog(self, checker):
+        assert not checker._is_critical_update("New table colors")
+        assert not checker._is_critical_update("")
+        assert not checker._is_critical_update(None)
+
+
+class TestUpdateCheckCache:
+    """Test the cached and conditional (ETag) update check."""
+
+    def _stale_entry(self, checker, update_info):
+        return {
+            "update_url": checker.update_url,
+            "current_version": checker.current_version,
+            "checked_at": time.time() - checker.CACHE_TTL_SECONDS - 1,
+            "update_info": update_info.to_dict(),
+            "etag": '"abc123"',
+            "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_request(self, checker):
+        checker._store_result(UpdateInfo(version="9.9.9"))
+        session = Mock()
+
+        update_info = await checker.check_for_updates(session=session)
+
+        assert update_info.version == "9.9.9"
+        session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_result(self, checker):
+        entry = self._stale_entry(checker, UpdateInfo(version="9.9.9", download_url="https://example.com/a.exe"))
+        GitHubUpdateChecker._session_cache[checker.update_url] = entry
+        response = Mock(status=304)
+        session = Mock()
+        session.get = Mock(return_value=AsyncContextManager(response))
+
+        update_info = await checker.check_for_updates(session=session)
+
+        assert update_info.version == "9.9.9"
+        assert update_info.download_url == "https://example.com/a.exe"
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc123"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        # The 304 refreshes the entry, so the next check within the TTL makes no request
+        refreshed = GitHubUpdateChecker._session_cache[checker.update_url]
+        assert time.time() - refreshed["checked_at"] < checker.CACHE_TTL_SECONDS
+        assert refreshed["etag"] == '"abc123"'
+
+
+class TestUpdateDownloader:
+    """Test update download verification."""
+
+    @pytest.mark.asyncio
+    async def test_checksum_match(self, temp_directory, monkeypatch):
+        monkeypatch.chdir(temp_directory)
+        payload = b"installer bytes"
+        response = Mock(status=200, headers={"content-length": str(len(payload))},
+                        content=ChunkedContent(payload[:5], payload[5:]))
+        session = Mock()
+        session.get = Mock(return_value=AsyncContextManager(response))
+        update_info = UpdateInfo(version="9.9.9", download_url="https://example.com/a.exe",
+                                 sha256=hashlib.sha256(payload).hexdigest())
+
+        filepath = await UpdateDownloader().download(update_info, session=session)
+
+        assert filepath is not None
+        assert (temp_directory / filepath).read_bytes() == payload
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch_deletes_file(self, temp_directory, monkeypatch):
+        monkeypatch.chdir(temp_directory)
+        payload = b"tampered bytes"
+        response = Mock(status=200, headers={"content-length": str(len(payload))},
+                        content=ChunkedContent(payload))
+        session = Mock()
+        session.get = Mock(return_value=AsyncContextManager(response))
+        update_info = UpdateInfo(version="9.9.9", download_url="https://example.com/a.exe",
+                                 sha256=hashlib.sha256(b"original bytes").hexdigest())
+
+        filepath = await UpdateDownloader().download(update_info, session=session)
+
+        assert filepath is None
+        assert not (temp_directory / "updates" / "TennisScraperUpdate_v9.9.9.exe").exists()
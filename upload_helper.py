@@ -16,12 +16,15 @@ import webbrowser
 import subprocess
 from pathlib import Path
 
+from build_and_deploy import RELEASES_DIR_NAME, github_repo, release_exe_name
+
 
 def open_upload_helper(version: str, changelog: str):
     """Open everything you need for manual upload"""
 
-    releases_dir = Path("releases")
-    exe_file = releases_dir / f"ITFTennisScraperPro_v{version}.exe"
+    # Same paths and naming as the builder, so the two scripts can't drift apart
+    releases_dir = Path.cwd() / RELEASES_DIR_NAME
+    exe_file = releases_dir / release_exe_name(version)
 
     print(f"🎾 Upload Helper for Version {version}")
     print("=" * 50)
@@ -37,7 +40,7 @@ def open_upload_helper(version: str, changelog: str):
     print()
 
     # Open GitHub releases page
-    github_url = "https://github.com/carpsesdema/itf-tennis-scraper/releases/new"
+    github_url = f"https://github.com/{github_repo()}/releases/new"
     print(f"🌐 Opening GitHub releases page...")
     webbrowser.open(github_url)
 